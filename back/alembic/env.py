@@ -1,5 +1,6 @@
 import os
 import sys
+from functools import lru_cache
 from logging.config import fileConfig
 from sqlalchemy import engine_from_config, pool, text
 from alembic import context
@@ -7,8 +8,8 @@ from dotenv import load_dotenv
 
 # Load environment variables from .env file
 # Try to find .env file in the project root (parent of alembic directory)
-env_path = os.path.join(os.path.dirname(__file__), '..', '.env')
-load_dotenv(dotenv_path=env_path)
+ENV_PATH = os.path.join(os.path.dirname(__file__), '..', '.env')
+load_dotenv(dotenv_path=ENV_PATH)
 
 config = context.config
 
@@ -17,15 +18,38 @@ if config.config_file_name is not None:
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from dapmeet.db.db import Base
-from dapmeet.models import user
-from dapmeet.models import meeting
-from dapmeet.models import segment
-from dapmeet.models import chat_message
-from dapmeet.models import subscription
+# Alembic commands that run migrations or compare against the models.
+# Read-only commands (current, history, heads, stamp, ...) skip the model import.
+METADATA_COMMANDS = {"upgrade", "downgrade", "revision", "check"}
 
-target_metadata = Base.metadata
 
+def metadata_needed() -> bool:
+    cmd_opts = config.cmd_opts
+    if cmd_opts is None or not hasattr(cmd_opts, "cmd"):
+        # Invoked programmatically (e.g. run_migrations.py) - load to be safe
+        return True
+    return cmd_opts.cmd[0].__name__ in METADATA_COMMANDS
+
+
+def load_target_metadata():
+    from dapmeet.db.db import Base
+    # Every model module must be listed here to register its tables on
+    # Base.metadata. meeting_participants is defined in meeting; the stray
+    # models/meeting_participants.py redefines it and must not be imported.
+    from dapmeet.models import user
+    from dapmeet.models import meeting
+    from dapmeet.models import segment
+    from dapmeet.models import meeting_stats
+    from dapmeet.models import chat_message
+    from dapmeet.models import prompt
+    from dapmeet.models import phone_verification
+    from dapmeet.models import subscription
+    return Base.metadata
+
+
+target_metadata = load_target_metadata() if metadata_needed() else None
+
+@lru_cache(maxsize=1)
 def get_url():
     url = config.get_main_option("sqlalchemy.url")
     if url is None:
@@ -35,7 +59,7 @@ def get_url():
             url_async = os.getenv("DATABASE_URL_ASYNC")
             if url_async:
                 # Convert async URL to sync URL (remove asyncpg driver)
-                url = url_async.replace("+asyncpg", "").replace("postgresql+asyncpg://", "postgresql://")
+                url = url_async.replace("+asyncpg", "")
     return url
 
 def run_migrations_offline() -> None:
@@ -56,13 +80,31 @@ def run_migrations_online() -> None:
     configuration = config.get_section(config.config_ini_section, {})
     configuration["sqlalchemy.url"] = get_url()
 
+    # Keep the migration connection pooled (LIFO keeps the most recently used,
+    # warm backend at the front). Set ALEMBIC_NULL_POOL=true to open a fresh
+    # connection per checkout instead.
+    if os.getenv("ALEMBIC_NULL_POOL", "false").lower() == "true":
+        pool_kwargs = {"poolclass": pool.NullPool}
+    else:
+        pool_kwargs = {
+            "poolclass": pool.QueuePool,
+            "pool_size": 5,
+            "pool_use_lifo": True,
+            "pool_pre_ping": True,
+        }
+
     connectable = engine_from_config(
         configuration,
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        **pool_kwargs,
     )
 
     with connectable.connect() as connection:
+        # Migration statements (mostly DDL) run exactly once, so there is
+        # nothing to gain from SQLAlchemy's compiled-statement cache. psycopg2
+        # never prepares server-side, so this is the only prepare step to skip.
+        connection.execution_options(compiled_cache=None)
+
         context.configure(
             connection=connection, 
             target_metadata=target_metadata,
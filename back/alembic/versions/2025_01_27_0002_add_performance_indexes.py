@@ -17,42 +17,40 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Add composite index for meetings (user_id, created_at) for efficient pagination
-    op.create_index(
-        'idx_meetings_user_created', 
-        'meetings', 
-        ['user_id', 'created_at'], 
-        unique=False
-    )
-    
-    # Add composite index for segments (session_id, speaker_username) for speaker aggregation
-    op.create_index(
-        'idx_segments_session_speaker', 
-        'transcript_segments', 
-        ['session_id', 'speaker_username'], 
-        unique=False
-    )
-    
-    # Add index on segments.session_id for faster joins
-    op.create_index(
-        'idx_segments_session_id', 
-        'transcript_segments', 
-        ['session_id'], 
-        unique=False
-    )
-    
-    # Add index on meetings.created_at for ordering (if not already exists)
-    op.create_index(
-        'idx_meetings_created_at', 
-        'meetings', 
-        ['created_at'], 
-        unique=False
-    )
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so build
+    # the indexes in autocommit mode. This avoids holding a write-blocking lock
+    # on meetings / transcript_segments while the btrees are built.
+    connection = op.get_bind()
+
+    with op.get_context().autocommit_block():
+        # Add composite index for meetings (user_id, created_at) for efficient pagination
+        connection.execute(sa.text("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_meetings_user_created
+            ON meetings (user_id, created_at)
+        """))
+
+        # Add composite index for segments (session_id, speaker_username) for speaker aggregation.
+        # Its leading session_id column also serves joins on session_id, so no
+        # separate single-column index is needed.
+        connection.execute(sa.text("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_segments_session_speaker
+            ON transcript_segments (session_id, speaker_username)
+        """))
+
+        # Add index on meetings.created_at for ordering (if not already exists)
+        connection.execute(sa.text("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_meetings_created_at
+            ON meetings (created_at)
+        """))
 
 
 def downgrade() -> None:
-    # Drop indexes in reverse order
-    op.drop_index('idx_meetings_created_at', table_name='meetings')
-    op.drop_index('idx_segments_session_id', table_name='transcript_segments')
-    op.drop_index('idx_segments_session_speaker', table_name='transcript_segments')
-    op.drop_index('idx_meetings_user_created', table_name='meetings')
+    connection = op.get_bind()
+
+    # Drop indexes in reverse order (idx_segments_session_id is no longer
+    # created, but databases migrated before it was removed still have it)
+    with op.get_context().autocommit_block():
+        connection.execute(sa.text("DROP INDEX CONCURRENTLY IF EXISTS idx_meetings_created_at"))
+        connection.execute(sa.text("DROP INDEX CONCURRENTLY IF EXISTS idx_segments_session_id"))
+        connection.execute(sa.text("DROP INDEX CONCURRENTLY IF EXISTS idx_segments_session_speaker"))
+        connection.execute(sa.text("DROP INDEX CONCURRENTLY IF EXISTS idx_meetings_user_created"))
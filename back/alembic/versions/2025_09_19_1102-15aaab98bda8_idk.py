@@ -42,7 +42,8 @@ def upgrade() -> None:
     op.drop_index('idx_meetings_created_at', table_name='meetings')
     op.drop_index('idx_meetings_user_created', table_name='meetings')
 
-    op.drop_index('idx_segments_session_id', table_name='transcript_segments')
+    # idx_segments_session_id is no longer created by perf_indexes_001
+    op.execute("DROP INDEX IF EXISTS idx_segments_session_id")
     op.drop_index('idx_segments_session_speaker', table_name='transcript_segments')
 
     # users table changes - online-safe sequence
@@ -20,11 +20,13 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Add index on prompt_type column for better dashboard metrics performance."""
-    # Add index on prompt_type for faster filtering by admin/user prompts
-    op.create_index('ix_prompts_prompt_type', 'prompts', ['prompt_type'])
+    # Add index on prompt_type for faster filtering by admin/user prompts.
+    # IF NOT EXISTS keeps this from failing (or duplicating the index) on
+    # databases where the prompts table migration's index is still present.
+    op.execute("CREATE INDEX IF NOT EXISTS ix_prompts_prompt_type ON prompts (prompt_type)")
 
 
 def downgrade() -> None:
     """Remove prompt_type index."""
     # Remove the index
-    op.drop_index('ix_prompts_prompt_type', table_name='prompts')
+    op.execute("DROP INDEX IF EXISTS ix_prompts_prompt_type")
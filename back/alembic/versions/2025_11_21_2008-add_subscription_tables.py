@@ -20,49 +20,74 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+def _schema_snapshot(connection):
+    """Fetch every catalog fact this migration branches on in one round-trip."""
+    result = connection.execute(text("""
+        SELECT 'type' AS kind, t.typname AS name, NULL AS column_name, NULL AS data_type
+        FROM pg_type t
+        WHERE t.typname IN ('subscriptionplan', 'subscriptionstatus')
+        UNION ALL
+        SELECT 'table', c.relname, NULL, NULL
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = 'public'
+        AND c.relkind = 'r'
+        AND c.relname IN ('subscriptions', 'subscription_history', 'meetings')
+        UNION ALL
+        SELECT 'index', i.indexname, NULL, NULL
+        FROM pg_indexes i
+        WHERE i.schemaname = 'public'
+        AND i.tablename IN ('subscriptions', 'subscription_history')
+        UNION ALL
+        SELECT 'column', c.relname, a.attname, format_type(a.atttypid, a.atttypmod)
+        FROM pg_attribute a
+        JOIN pg_class c ON c.oid = a.attrelid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = 'public'
+        AND c.relkind = 'r'
+        AND c.relname IN ('subscriptions', 'subscription_history', 'meetings')
+        AND a.attnum > 0
+        AND NOT a.attisdropped
+    """))
+    
+    types, tables, indexes, columns = set(), set(), set(), {}
+    for kind, name, column_name, data_type in result:
+        if kind == 'type':
+            types.add(name)
+        elif kind == 'table':
+            tables.add(name)
+        elif kind == 'index':
+            indexes.add(name)
+        else:
+            columns[(name, column_name)] = data_type
+    return types, tables, indexes, columns
+
+
+def _index_ddl(index_name, table_name, columns, unique=False):
+    """Render a CREATE INDEX statement for the batched index DDL below."""
+    return "CREATE {}INDEX IF NOT EXISTS {} ON {} ({})".format(
+        "UNIQUE " if unique else "", index_name, table_name, ", ".join(columns)
+    )
+
+
 def upgrade() -> None:
-    # Create enum types first (if they don't exist)
     connection = op.get_bind()
+    existing_types, existing_tables, existing_indexes, existing_columns = _schema_snapshot(connection)
     
-    # Check if types exist before creating
-    result = connection.execute(text("""
-        SELECT EXISTS (
-            SELECT 1 FROM pg_type WHERE typname = 'subscriptionplan'
-        )
-    """))
-    if not result.scalar():
+    # Index DDL is collected here and sent to the server as one batch at the end
+    index_statements = []
+    
+    # Create enum types first (if they don't exist)
+    if 'subscriptionplan' not in existing_types:
         op.execute("CREATE TYPE subscriptionplan AS ENUM ('free', 'standard', 'premium')")
     
-    result = connection.execute(text("""
-        SELECT EXISTS (
-            SELECT 1 FROM pg_type WHERE typname = 'subscriptionstatus'
-        )
-    """))
-    if not result.scalar():
+    if 'subscriptionstatus' not in existing_types:
         op.execute("CREATE TYPE subscriptionstatus AS ENUM ('active', 'expired', 'cancelled')")
     
-    # Check if subscriptions table exists
-    result = connection.execute(text("""
-        SELECT EXISTS (
-            SELECT 1 FROM information_schema.tables 
-            WHERE table_schema = 'public' 
-            AND table_name = 'subscriptions'
-        )
-    """))
-    subscriptions_exists = result.scalar()
+    subscriptions_exists = 'subscriptions' in existing_tables
     
     # Check if plan column exists (to detect incomplete table creation)
-    plan_column_exists = False
-    if subscriptions_exists:
-        result = connection.execute(text("""
-            SELECT EXISTS (
-                SELECT 1 FROM information_schema.columns 
-                WHERE table_schema = 'public' 
-                AND table_name = 'subscriptions' 
-                AND column_name = 'plan'
-            )
-        """))
-        plan_column_exists = result.scalar()
+    plan_column_exists = ('subscriptions', 'plan') in existing_columns
     
     # Create subscriptions table with enum types (if it doesn't exist or is incomplete)
     if not subscriptions_exists or not plan_column_exists:
@@ -85,68 +110,31 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id')
         )
         
-        # Create indexes
-        op.create_index(op.f('ix_subscriptions_id'), 'subscriptions', ['id'], unique=False)
-        op.create_index(op.f('ix_subscriptions_user_id'), 'subscriptions', ['user_id'], unique=True)
-        op.create_index(op.f('ix_subscriptions_plan'), 'subscriptions', ['plan'], unique=False)
-        op.create_index(op.f('ix_subscriptions_status'), 'subscriptions', ['status'], unique=False)
+        # Create indexes (id is already indexed by the primary key)
+        index_statements.append(_index_ddl('ix_subscriptions_user_id', 'subscriptions', ['user_id'], unique=True))
+        index_statements.append(_index_ddl('ix_subscriptions_plan', 'subscriptions', ['plan']))
+        index_statements.append(_index_ddl('ix_subscriptions_status', 'subscriptions', ['status']))
     else:
         # Table exists, check which columns exist and create missing indexes
         indexes_to_create = {
-            'ix_subscriptions_id': (['id'], False),
             'ix_subscriptions_user_id': (['user_id'], True),
             'ix_subscriptions_plan': (['plan'], False),
             'ix_subscriptions_status': (['status'], False)
         }
         
         for index_name, (columns, is_unique) in indexes_to_create.items():
-            # Check if index exists
-            result = connection.execute(text(f"""
-                SELECT EXISTS (
-                    SELECT 1 FROM pg_indexes 
-                    WHERE indexname = '{index_name}'
-                )
-            """))
-            index_exists = result.scalar()
+            if index_name in existing_indexes:
+                continue
             
-            if not index_exists:
-                # Check if all columns exist
-                all_columns_exist = True
-                for col in columns:
-                    result = connection.execute(text(f"""
-                        SELECT EXISTS (
-                            SELECT 1 FROM information_schema.columns 
-                            WHERE table_name = 'subscriptions' AND column_name = '{col}'
-                        )
-                    """))
-                    if not result.scalar():
-                        all_columns_exist = False
-                        break
-                
-                if all_columns_exist:
-                    # All columns exist, create index
-                    op.create_index(index_name, 'subscriptions', columns, unique=is_unique)
+            # Only create the index if all of its columns exist
+            if all(('subscriptions', col) in existing_columns for col in columns):
+                index_statements.append(_index_ddl(index_name, 'subscriptions', columns, unique=is_unique))
     
     # Check if subscription_history table exists
-    result = connection.execute(text("""
-        SELECT EXISTS (
-            SELECT 1 FROM information_schema.tables 
-            WHERE table_name = 'subscription_history'
-        )
-    """))
-    history_exists = result.scalar()
+    history_exists = 'subscription_history' in existing_tables
     
     # Check if subscriptions.id is INTEGER (required for FK)
-    subscriptions_id_type = None
-    if subscriptions_exists:
-        result = connection.execute(text("""
-            SELECT data_type 
-            FROM information_schema.columns 
-            WHERE table_name = 'subscriptions' AND column_name = 'id'
-        """))
-        row = result.fetchone()
-        if row:
-            subscriptions_id_type = row[0]
+    subscriptions_id_type = existing_columns.get(('subscriptions', 'id'))
     
     # Create subscription_history table (if it doesn't exist and subscriptions has correct structure)
     if not history_exists and subscriptions_exists and subscriptions_id_type == 'integer':
@@ -165,34 +153,19 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id')
         )
         
-        # Create indexes for subscription_history
-        op.create_index(op.f('ix_subscription_history_id'), 'subscription_history', ['id'], unique=False)
-        op.create_index(op.f('ix_subscription_history_subscription_id'), 'subscription_history', ['subscription_id'], unique=False)
+        # Create indexes for subscription_history (id is covered by the primary key)
+        index_statements.append(_index_ddl('ix_subscription_history_subscription_id', 'subscription_history', ['subscription_id']))
     elif history_exists:
         # Table exists, check indexes
-        for index_name in ['ix_subscription_history_id', 'ix_subscription_history_subscription_id']:
-            result = connection.execute(text(f"""
-                SELECT EXISTS (
-                    SELECT 1 FROM pg_indexes 
-                    WHERE indexname = '{index_name}'
-                )
-            """))
-            if not result.scalar():
-                if 'subscription_id' in index_name:
-                    op.create_index(index_name, 'subscription_history', ['subscription_id'], unique=False)
-                else:
-                    op.create_index(index_name, 'subscription_history', ['id'], unique=False)
+        if 'ix_subscription_history_subscription_id' not in existing_indexes:
+            index_statements.append(_index_ddl('ix_subscription_history_subscription_id', 'subscription_history', ['subscription_id']))
+    
+    # Create all pending indexes in a single round-trip
+    if index_statements:
+        op.execute(";\n".join(index_statements))
     
     # Check if subscription_plan column exists in meetings table
-    result = connection.execute(text("""
-        SELECT EXISTS (
-            SELECT 1 FROM information_schema.columns 
-            WHERE table_schema = 'public' 
-            AND table_name = 'meetings' 
-            AND column_name = 'subscription_plan'
-        )
-    """))
-    column_exists = result.scalar()
+    column_exists = ('meetings', 'subscription_plan') in existing_columns
     
     # Add subscription_plan column to meetings table (if it doesn't exist)
     if not column_exists:
@@ -219,14 +192,12 @@ def downgrade() -> None:
     
     # Drop subscription_history table
     op.drop_index(op.f('ix_subscription_history_subscription_id'), table_name='subscription_history')
-    op.drop_index(op.f('ix_subscription_history_id'), table_name='subscription_history')
     op.drop_table('subscription_history')
     
     # Drop subscriptions table
     op.drop_index(op.f('ix_subscriptions_status'), table_name='subscriptions')
     op.drop_index(op.f('ix_subscriptions_plan'), table_name='subscriptions')
     op.drop_index(op.f('ix_subscriptions_user_id'), table_name='subscriptions')
-    op.drop_index(op.f('ix_subscriptions_id'), table_name='subscriptions')
     op.drop_table('subscriptions')
     
     # Drop enum types
@@ -19,105 +19,115 @@ down_revision: Union[str, None] = 'add_subscription_tables_001'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Number of users given a premium subscription per committed batch
+BACKFILL_BATCH_SIZE = 1000
+
 
 def upgrade() -> None:
     """
     Set all existing users to premium plan (PRO users).
     Creates premium subscriptions for all users who don't have one.
     Updates all existing free/standard subscriptions to premium.
+
+    Not atomic: the new subscriptions are inserted in separately committed
+    batches, and starting those commits any earlier migrations of the same
+    run. If the migration fails after that, those rows stay but the revision
+    is not stamped. Every step only touches rows it has not handled yet, so
+    re-running the upgrade completes it. The plan upgrade, history and
+    meetings backfill run afterwards in the migration's transaction.
     """
     connection = op.get_bind()
     
-    # Get all user IDs who don't have a subscription yet
-    result = connection.execute(text("""
-        SELECT id FROM users 
-        WHERE id NOT IN (SELECT user_id FROM subscriptions)
-    """))
-    user_ids = [row[0] for row in result]
-    
-    # Check if subscriptions table exists and has data
-    result = connection.execute(text("""
-        SELECT EXISTS (
-            SELECT FROM information_schema.tables 
-            WHERE table_schema = 'public' 
-            AND table_name = 'subscriptions'
-        )
-    """))
-    table_exists = result.scalar()
+    # Snapshot the schema once via the pg_catalog-backed inspector instead of
+    # probing information_schema for every table/column check
+    inspector = sa.inspect(connection)
+    existing_tables = set(inspector.get_table_names(schema='public'))
     
-    if not table_exists:
+    # Check if subscriptions table exists
+    if 'subscriptions' not in existing_tables:
         # Table doesn't exist yet, skip this migration step
         print("Subscriptions table does not exist yet. Skipping premium upgrade.")
         return
     
-    # Store old plans BEFORE update for history (only if table has subscriptions)
-    result = connection.execute(text("""
-        SELECT COUNT(*) FROM subscriptions
-    """))
-    subscription_count = result.scalar()
+    subscription_columns = {c['name'] for c in inspector.get_columns('subscriptions', schema='public')}
+    meeting_columns = {c['name'] for c in inspector.get_columns('meetings', schema='public')}
     
-    if subscription_count == 0:
-        # No subscriptions exist yet, skip history creation
-        print("No existing subscriptions found. Skipping history creation.")
-    else:
-        connection.execute(text("""
-            CREATE TEMP TABLE temp_subscription_changes AS
+    # Verify table structure before updating - check if plan column exists
+    if 'plan' not in subscription_columns:
+        print("WARNING: subscriptions table exists but 'plan' column is missing.")
+        print("This means add_subscription_tables_001 migration was not applied correctly.")
+        print("Skipping set_all_users_premium_001 migration.")
+        return
+    
+    # Create premium subscriptions for all users without subscriptions.
+    # Walk users in keyset-ordered batches (id > last seen id) so each batch is
+    # a short, separately committed statement instead of one giant transaction.
+    # MAX(id) is computed server-side so the cursor follows the DB collation.
+    # This runs first: entering autocommit_block() commits everything before
+    # it, so anything left after it stays in the migration's own transaction
+    # and commits together with the revision stamp.
+    with op.get_context().autocommit_block():
+        last_id = ''
+        while True:
+            last_id = connection.execute(text("""
+                WITH batch AS (
+                    SELECT u.id
+                    FROM users u
+                    LEFT JOIN subscriptions s ON s.user_id = u.id
+                    WHERE s.user_id IS NULL
+                    AND u.id > :last_id
+                    ORDER BY u.id
+                    LIMIT :batch_size
+                ),
+                inserted AS (
+                    INSERT INTO public.subscriptions (user_id, plan, status, start_date, last_updated, created_at)
+                    SELECT
+                        id,
+                        'premium'::public.subscriptionplan,
+                        'active'::public.subscriptionstatus,
+                        NOW(),
+                        NOW(),
+                        NOW()
+                    FROM batch
+                )
+                SELECT MAX(id) FROM batch
+            """), {"last_id": last_id, "batch_size": BACKFILL_BATCH_SIZE}).scalar()
+            if last_id is None:
+                break
+    
+    # Upgrade all existing free/standard subscriptions to premium and record
+    # the history in one statement. The "before" CTE reads the pre-update
+    # snapshot, so the old plan/status are available without a temp table.
+    connection.execute(text("""
+        WITH before AS (
             SELECT 
                 id as subscription_id,
                 plan as old_plan,
                 status as old_status
             FROM subscriptions
             WHERE plan IN ('free'::subscriptionplan, 'standard'::subscriptionplan)
-        """))
-    
-    # Update all existing free/standard subscriptions to premium (if any exist)
-    if subscription_count > 0:
-        connection.execute(text("""
+        ),
+        updated AS (
             UPDATE subscriptions 
             SET plan = 'premium'::subscriptionplan,
                 last_updated = NOW()
-            WHERE plan IN ('free'::subscriptionplan, 'standard'::subscriptionplan)
-        """))
-        
-        # Create history entries for subscriptions that were updated (free/standard -> premium)
-        connection.execute(text("""
-            INSERT INTO subscription_history (subscription_id, old_plan, new_plan, old_status, new_status, changed_by, reason, changed_at)
-            SELECT 
-                tsc.subscription_id,
-                tsc.old_plan,
-                'premium'::subscriptionplan,
-                tsc.old_status,
-                'active'::subscriptionstatus,
-                'system',
-                'Migration: Upgraded to premium plan (PRO user)',
-                NOW()
-            FROM temp_subscription_changes tsc
-        """))
-    
-    # Verify table structure before inserting - check if plan column exists
-    result = connection.execute(text("""
-        SELECT EXISTS (
-            SELECT 1 FROM information_schema.columns 
-            WHERE table_schema = 'public' 
-            AND table_name = 'subscriptions' 
-            AND column_name = 'plan'
+            FROM before
+            WHERE subscriptions.id = before.subscription_id
+            RETURNING subscriptions.id
         )
+        INSERT INTO subscription_history (subscription_id, old_plan, new_plan, old_status, new_status, changed_by, reason, changed_at)
+        SELECT 
+            b.subscription_id,
+            b.old_plan,
+            'premium'::subscriptionplan,
+            b.old_status,
+            'active'::subscriptionstatus,
+            'system',
+            'Migration: Upgraded to premium plan (PRO user)',
+            NOW()
+        FROM before b
+        JOIN updated u ON u.id = b.subscription_id
     """))
-    plan_column_exists = result.scalar()
-    
-    if not plan_column_exists:
-        print("WARNING: subscriptions table exists but 'plan' column is missing.")
-        print("This means add_subscription_tables_001 migration was not applied correctly.")
-        print("Skipping set_all_users_premium_001 migration.")
-        return
-    
-    # Create premium subscriptions for all users without subscriptions
-    if user_ids:
-        for user_id in user_ids:
-            connection.execute(text("""
-                INSERT INTO public.subscriptions (user_id, plan, status, start_date, last_updated, created_at)
-                VALUES (:user_id, 'premium'::public.subscriptionplan, 'active'::public.subscriptionstatus, NOW(), NOW(), NOW())
-            """), {"user_id": user_id})
     
     # Create history entries for new premium subscriptions (users without any subscription before)
     connection.execute(text("""
@@ -136,9 +146,18 @@ def upgrade() -> None:
         AND s.id NOT IN (SELECT subscription_id FROM subscription_history)
     """))
     
-    # Clean up temp table (if it was created)
-    if subscription_count > 0:
-        connection.execute(text("DROP TABLE IF EXISTS temp_subscription_changes"))
+    # Backfill meetings.subscription_plan from the owner's subscription in one
+    # set-based UPDATE. The join on meetings.user_id is served by the leading
+    # column of idx_meetings_user_id_created_at, so no temporary index is needed.
+    # Only NULL rows are touched, which keeps re-runs cheap and idempotent.
+    if 'subscription_plan' in meeting_columns:
+        connection.execute(text("""
+            UPDATE meetings 
+            SET subscription_plan = s.plan::text
+            FROM subscriptions s
+            WHERE s.user_id = meetings.user_id
+            AND meetings.subscription_plan IS NULL
+        """))
 
 
 def downgrade() -> None:
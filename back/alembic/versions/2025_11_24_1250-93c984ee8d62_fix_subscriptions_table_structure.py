@@ -24,47 +24,34 @@ def upgrade() -> None:
     """Fix subscriptions table structure - ensure plan column exists."""
     connection = op.get_bind()
     
-    # Check if enum types exist, create if not
-    result = connection.execute(text("""
-        SELECT EXISTS (
-            SELECT 1 FROM pg_type WHERE typname = 'subscriptionplan'
-        )
-    """))
-    if not result.scalar():
-        print("Creating subscriptionplan enum type...")
-        op.execute("CREATE TYPE subscriptionplan AS ENUM ('free', 'standard', 'premium')")
-    
-    result = connection.execute(text("""
-        SELECT EXISTS (
-            SELECT 1 FROM pg_type WHERE typname = 'subscriptionstatus'
-        )
-    """))
-    if not result.scalar():
-        print("Creating subscriptionstatus enum type...")
-        op.execute("CREATE TYPE subscriptionstatus AS ENUM ('active', 'expired', 'cancelled')")
+    # Fetch the table facts this migration branches on in one round-trip,
+    # straight from pg_catalog rather than the information_schema views
+    schema = connection.execute(text("""
+        SELECT
+            to_regclass('public.subscriptions') IS NOT NULL AS table_exists,
+            EXISTS (
+                SELECT 1 FROM pg_attribute 
+                WHERE attrelid = to_regclass('public.subscriptions') 
+                AND attname = 'plan' 
+                AND NOT attisdropped
+            ) AS plan_column_exists
+    """)).mappings().first()
     
-    # Check if subscriptions table exists
-    result = connection.execute(text("""
-        SELECT EXISTS (
-            SELECT 1 FROM information_schema.tables 
-            WHERE table_schema = 'public' 
-            AND table_name = 'subscriptions'
-        )
-    """))
-    table_exists = result.scalar()
+    # Create enum types if they don't exist (single server-side statement)
+    op.execute("""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'subscriptionplan') THEN
+                CREATE TYPE subscriptionplan AS ENUM ('free', 'standard', 'premium');
+            END IF;
+            IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'subscriptionstatus') THEN
+                CREATE TYPE subscriptionstatus AS ENUM ('active', 'expired', 'cancelled');
+            END IF;
+        END $$;
+    """)
     
-    # Check if plan column exists
-    plan_column_exists = False
-    if table_exists:
-        result = connection.execute(text("""
-            SELECT EXISTS (
-                SELECT 1 FROM information_schema.columns 
-                WHERE table_schema = 'public' 
-                AND table_name = 'subscriptions' 
-                AND column_name = 'plan'
-            )
-        """))
-        plan_column_exists = result.scalar()
+    table_exists = schema["table_exists"]
+    plan_column_exists = schema["plan_column_exists"]
     
     # If table exists but plan column is missing, we need to fix it
     if table_exists and not plan_column_exists:
@@ -83,11 +70,11 @@ def upgrade() -> None:
                 
                 -- Drop foreign key constraint if it exists
                 ALTER TABLE subscriptions DROP CONSTRAINT IF EXISTS subscriptions_user_id_fkey;
+                
+                -- Drop the table itself in the same server-side statement
+                DROP TABLE IF EXISTS subscriptions CASCADE;
             END $$;
         """))
-        
-        # Drop the table using direct SQL
-        connection.execute(text("DROP TABLE IF EXISTS subscriptions CASCADE"))
         table_exists = False
     
     # Create subscriptions table if it doesn't exist
@@ -106,15 +93,26 @@ def upgrade() -> None:
             sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
             sa.PrimaryKeyConstraint('id')
         )
-        
-        # Create indexes
-        op.create_index('ix_subscriptions_id', 'subscriptions', ['id'], unique=False)
-        op.create_index('ix_subscriptions_user_id', 'subscriptions', ['user_id'], unique=True)
-        op.create_index('ix_subscriptions_plan', 'subscriptions', ['plan'], unique=False)
-        op.create_index('ix_subscriptions_status', 'subscriptions', ['status'], unique=False)
         print("subscriptions table created successfully.")
     else:
         print("subscriptions table already exists with correct structure.")
+    
+    # Ensure indexes exist. CREATE INDEX CONCURRENTLY must run outside a
+    # transaction block; building concurrently keeps an existing, populated
+    # subscriptions table writable while a missing index is built.
+    # id needs no index of its own: subscriptions_pkey already covers it.
+    indexes = [
+        ("ix_subscriptions_user_id", ["user_id"], True),
+        ("ix_subscriptions_plan", ["plan"], False),
+        ("ix_subscriptions_status", ["status"], False),
+    ]
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_subscriptions_id")
+        for name, columns, unique in indexes:
+            op.execute(
+                f"CREATE {'UNIQUE ' if unique else ''}INDEX CONCURRENTLY IF NOT EXISTS "
+                f"{name} ON subscriptions ({', '.join(columns)})"
+            )
 
 
 def downgrade() -> None:
@@ -8,8 +8,6 @@ Create Date: 2025-11-24 13:09:54.119835
 from typing import Sequence, Union
 
 from alembic import op
-import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
 from sqlalchemy import text
 
 
@@ -24,110 +22,55 @@ def upgrade() -> None:
     """Ensure subscription_history table exists with all required fields."""
     connection = op.get_bind()
     
-    # Check if enum types exist, create if not
-    result = connection.execute(text("""
-        SELECT EXISTS (
-            SELECT 1 FROM pg_type WHERE typname = 'subscriptionplan'
-        )
-    """))
-    if not result.scalar():
-        print("Creating subscriptionplan enum type...")
-        op.execute("CREATE TYPE subscriptionplan AS ENUM ('free', 'standard', 'premium')")
-    
-    result = connection.execute(text("""
-        SELECT EXISTS (
-            SELECT 1 FROM pg_type WHERE typname = 'subscriptionstatus'
-        )
-    """))
-    if not result.scalar():
-        print("Creating subscriptionstatus enum type...")
-        op.execute("CREATE TYPE subscriptionstatus AS ENUM ('active', 'expired', 'cancelled')")
+    # Create enum types if they don't exist (single server-side statement)
+    op.execute("""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'subscriptionplan') THEN
+                CREATE TYPE subscriptionplan AS ENUM ('free', 'standard', 'premium');
+            END IF;
+            IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'subscriptionstatus') THEN
+                CREATE TYPE subscriptionstatus AS ENUM ('active', 'expired', 'cancelled');
+            END IF;
+        END $$;
+    """)
     
     # Check if subscriptions table exists (required for FK)
-    result = connection.execute(text("""
-        SELECT EXISTS (
-            SELECT 1 FROM information_schema.tables 
-            WHERE table_schema = 'public' 
-            AND table_name = 'subscriptions'
-        )
-    """))
-    subscriptions_exists = result.scalar()
+    subscriptions_exists = connection.execute(text(
+        "SELECT to_regclass('public.subscriptions') IS NOT NULL"
+    )).scalar()
     
     if not subscriptions_exists:
         print("WARNING: subscriptions table does not exist. Cannot create subscription_history table.")
         print("Please ensure add_subscription_tables_001 migration is applied first.")
         return
     
-    # Check if subscription_history table exists
-    result = connection.execute(text("""
-        SELECT EXISTS (
-            SELECT 1 FROM information_schema.tables 
-            WHERE table_schema = 'public' 
-            AND table_name = 'subscription_history'
+    # Idempotent DDL: Postgres skips whatever already exists, so no
+    # per-table/per-index existence probes are needed
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS subscription_history (
+            id SERIAL NOT NULL,
+            subscription_id INTEGER NOT NULL,
+            old_plan subscriptionplan,
+            new_plan subscriptionplan NOT NULL,
+            old_status subscriptionstatus,
+            new_status subscriptionstatus NOT NULL,
+            changed_by VARCHAR,
+            reason VARCHAR(500),
+            changed_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+            PRIMARY KEY (id),
+            FOREIGN KEY (subscription_id) REFERENCES subscriptions (id) ON DELETE CASCADE
         )
-    """))
-    history_exists = result.scalar()
+    """)
     
-    if not history_exists:
-        print("Creating subscription_history table...")
-        op.create_table(
-            'subscription_history',
-            sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
-            sa.Column('subscription_id', sa.Integer(), nullable=False),
-            sa.Column('old_plan', postgresql.ENUM('free', 'standard', 'premium', name='subscriptionplan', create_type=False), nullable=True),
-            sa.Column('new_plan', postgresql.ENUM('free', 'standard', 'premium', name='subscriptionplan', create_type=False), nullable=False),
-            sa.Column('old_status', postgresql.ENUM('active', 'expired', 'cancelled', name='subscriptionstatus', create_type=False), nullable=True),
-            sa.Column('new_status', postgresql.ENUM('active', 'expired', 'cancelled', name='subscriptionstatus', create_type=False), nullable=False),
-            sa.Column('changed_by', sa.String(), nullable=True),
-            sa.Column('reason', sa.String(length=500), nullable=True),
-            sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-            sa.ForeignKeyConstraint(['subscription_id'], ['subscriptions.id'], ondelete='CASCADE'),
-            sa.PrimaryKeyConstraint('id')
-        )
-        
-        # Create indexes for subscription_history
-        op.create_index('ix_subscription_history_id', 'subscription_history', ['id'], unique=False)
-        op.create_index('ix_subscription_history_subscription_id', 'subscription_history', ['subscription_id'], unique=False)
-        print("subscription_history table created successfully.")
-    else:
-        print("subscription_history table already exists. Checking indexes...")
-        
-        # Check and create missing indexes
-        index_names = {
-            'ix_subscription_history_id': ['id'],
-            'ix_subscription_history_subscription_id': ['subscription_id']
-        }
-        
-        for index_name, columns in index_names.items():
-            result = connection.execute(text(f"""
-                SELECT EXISTS (
-                    SELECT 1 FROM pg_indexes 
-                    WHERE schemaname = 'public'
-                    AND indexname = '{index_name}'
-                )
-            """))
-            if not result.scalar():
-                print(f"Creating missing index: {index_name}")
-                op.create_index(index_name, 'subscription_history', columns, unique=False)
-        
-        print("subscription_history table structure verified.")
+    # Create indexes for subscription_history. id is covered by the primary
+    # key, so drop the redundant ix_subscription_history_id left by older runs.
+    op.execute("DROP INDEX IF EXISTS ix_subscription_history_id")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_subscription_history_subscription_id ON subscription_history (subscription_id)")
+    print("subscription_history table structure verified.")
 
 
 def downgrade() -> None:
     """Remove subscription_history table if it exists."""
-    connection = op.get_bind()
-    
-    result = connection.execute(text("""
-        SELECT EXISTS (
-            SELECT 1 FROM information_schema.tables 
-            WHERE table_schema = 'public' 
-            AND table_name = 'subscription_history'
-        )
-    """))
-    
-    if result.scalar():
-        # Drop indexes first
-        op.drop_index('ix_subscription_history_subscription_id', table_name='subscription_history')
-        op.drop_index('ix_subscription_history_id', table_name='subscription_history')
-        # Drop table
-        op.drop_table('subscription_history')
+    # Dropping the table also drops its indexes
+    op.execute("DROP TABLE IF EXISTS subscription_history")
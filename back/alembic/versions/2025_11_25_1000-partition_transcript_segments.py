@@ -0,0 +1,123 @@
+"""partition_transcript_segments
+
+Revision ID: partition_transcript_segments_001
+Revises: 0ccfa50b3519
+Create Date: 2025-11-25 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'partition_transcript_segments_001'
+down_revision: Union[str, None] = '0ccfa50b3519'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Number of hash partitions for transcript_segments
+SEGMENT_PARTITIONS = 8
+
+
+def _create_segment_indexes(connection) -> None:
+    """Recreate the transcript_segments indexes that exist at this revision.
+
+    These are the ones from 3eb55c7d589f; idx_segments_session_speaker was
+    dropped in 15aaab98bda8 and stays dropped. On a partitioned table each
+    index is created on every partition.
+    """
+    connection.execute(text("""
+        CREATE INDEX IF NOT EXISTS idx_transcript_segments_session_timestamp
+        ON transcript_segments(session_id, timestamp)
+    """))
+    connection.execute(text("""
+        CREATE INDEX IF NOT EXISTS idx_transcript_segments_timestamp
+        ON transcript_segments USING BRIN (timestamp) WITH (pages_per_range = 32)
+    """))
+    connection.execute(text("""
+        CREATE INDEX IF NOT EXISTS idx_transcript_segments_google_meet_user_id
+        ON transcript_segments(google_meet_user_id)
+    """))
+
+
+def _swap_segments_table(connection, new_table: str) -> None:
+    """Copy rows into new_table and replace transcript_segments with it.
+
+    The id sequence is handed over to the new table first so that dropping the
+    old table does not drop the sequence with it.
+    """
+    connection.execute(text(f"""
+        INSERT INTO {new_table}
+        SELECT * FROM transcript_segments
+    """))
+    connection.execute(text(f"""
+        DO $$
+        DECLARE
+            seq text := pg_get_serial_sequence('transcript_segments', 'id');
+        BEGIN
+            IF seq IS NOT NULL THEN
+                EXECUTE 'ALTER SEQUENCE ' || seq || ' OWNED BY {new_table}.id';
+            END IF;
+        END $$;
+    """))
+    connection.execute(text("DROP TABLE transcript_segments"))
+    connection.execute(text(f"ALTER TABLE {new_table} RENAME TO transcript_segments"))
+    connection.execute(text(f"""
+        ALTER TABLE transcript_segments
+        RENAME CONSTRAINT {new_table}_pkey TO transcript_segments_pkey
+    """))
+    connection.execute(text(f"""
+        ALTER TABLE transcript_segments
+        RENAME CONSTRAINT {new_table}_session_id_fkey TO transcript_segments_session_id_fkey
+    """))
+
+
+def upgrade() -> None:
+    """Hash-partition transcript_segments by session_id.
+
+    Every segment query filters on session_id, so each one is pruned to a
+    single partition. The primary key must include the partition key, so it
+    becomes (id, session_id); id stays unique because it comes from the
+    existing sequence.
+    """
+    connection = op.get_bind()
+
+    connection.execute(text("""
+        CREATE TABLE transcript_segments_partitioned (
+            LIKE transcript_segments INCLUDING DEFAULTS,
+            CONSTRAINT transcript_segments_partitioned_pkey PRIMARY KEY (id, session_id),
+            CONSTRAINT transcript_segments_partitioned_session_id_fkey
+                FOREIGN KEY (session_id) REFERENCES meetings(unique_session_id) ON DELETE CASCADE
+        ) PARTITION BY HASH (session_id)
+    """))
+
+    for remainder in range(SEGMENT_PARTITIONS):
+        connection.execute(text(f"""
+            CREATE TABLE transcript_segments_p{remainder}
+            PARTITION OF transcript_segments_partitioned
+            FOR VALUES WITH (MODULUS {SEGMENT_PARTITIONS}, REMAINDER {remainder})
+        """))
+
+    _swap_segments_table(connection, 'transcript_segments_partitioned')
+    _create_segment_indexes(connection)
+
+
+def downgrade() -> None:
+    """Convert transcript_segments back to a regular table."""
+    connection = op.get_bind()
+
+    connection.execute(text("""
+        CREATE TABLE transcript_segments_plain (
+            LIKE transcript_segments INCLUDING DEFAULTS,
+            CONSTRAINT transcript_segments_plain_pkey PRIMARY KEY (id),
+            CONSTRAINT transcript_segments_plain_session_id_fkey
+                FOREIGN KEY (session_id) REFERENCES meetings(unique_session_id) ON DELETE CASCADE
+        )
+    """))
+
+    # Dropping the partitioned parent drops its partitions as well
+    _swap_segments_table(connection, 'transcript_segments_plain')
+    _create_segment_indexes(connection)
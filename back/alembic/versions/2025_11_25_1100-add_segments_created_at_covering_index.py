@@ -0,0 +1,56 @@
+"""add_segments_created_at_covering_index
+
+Revision ID: segments_created_at_idx_001
+Revises: partition_transcript_segments_001
+Create Date: 2025-11-25 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'segments_created_at_idx_001'
+down_revision: Union[str, None] = 'partition_transcript_segments_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partitions transcript_segments_p0..p7 created by partition_transcript_segments_001
+SEGMENT_PARTITIONS = 8
+
+INDEX_NAME = 'idx_transcript_segments_created_at'
+INDEX_DEFINITION = '(created_at DESC) INCLUDE (id, session_id, speaker_username, timestamp)'
+
+
+def upgrade() -> None:
+    """Covering index for the admin activity feed's latest-segments query.
+
+    The feed reads id, session_id, speaker_username and timestamp of the ten
+    most recent segments, so with these columns included the query is an
+    index-only scan. A partitioned parent does not accept CREATE INDEX
+    CONCURRENTLY, and a plain build would block segment inserts on every
+    partition, so the parent index is created empty (ON ONLY) and each
+    partition's index is built concurrently and attached to it.
+    """
+    connection = op.get_bind()
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        connection.execute(sa.text(f"""
+            CREATE INDEX IF NOT EXISTS {INDEX_NAME}
+            ON ONLY transcript_segments {INDEX_DEFINITION}
+        """))
+        for remainder in range(SEGMENT_PARTITIONS):
+            connection.execute(sa.text(f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME}_p{remainder}
+                ON transcript_segments_p{remainder} {INDEX_DEFINITION}
+            """))
+            # The parent index becomes valid once every partition is attached
+            connection.execute(sa.text(f"ALTER INDEX {INDEX_NAME} ATTACH PARTITION {INDEX_NAME}_p{remainder}"))
+
+
+def downgrade() -> None:
+    """Drop the activity feed covering index; its partition indexes go with it."""
+    op.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
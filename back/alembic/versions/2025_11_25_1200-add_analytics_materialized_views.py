@@ -0,0 +1,83 @@
+"""add_analytics_materialized_views
+
+Revision ID: analytics_mviews_001
+Revises: segments_created_at_idx_001
+Create Date: 2025-11-25 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'analytics_mviews_001'
+down_revision: Union[str, None] = 'segments_created_at_idx_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Daily rollups behind the admin time-series analytics endpoints.
+
+    Each view holds one row per day. The unique index on day is required for
+    REFRESH MATERIALIZED VIEW CONCURRENTLY, which the API runs periodically.
+    The refresh time lives in the one-row analytics_views_refresh table
+    rather than in the views: a per-row timestamp would change every row on
+    every refresh and defeat the concurrent refresh's row diff.
+    """
+    op.create_table(
+        'analytics_views_refresh',
+        sa.Column('id', sa.Boolean(), server_default=sa.true(), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.CheckConstraint('id', name='ck_analytics_views_refresh_single_row'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("INSERT INTO analytics_views_refresh DEFAULT VALUES")
+
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_user_reg_daily AS
+        SELECT date_trunc('day', created_at) AS day,
+               count(*) AS count
+        FROM users
+        GROUP BY 1
+    """)
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_user_reg_daily_day ON mv_user_reg_daily (day)")
+
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_meeting_counts_daily AS
+        SELECT date_trunc('day', created_at) AS day,
+               count(*) AS count
+        FROM meetings
+        GROUP BY 1
+    """)
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_meeting_counts_daily_day ON mv_meeting_counts_daily (day)")
+
+    # Sum and count rather than average, so the API can re-bucket by
+    # week/month/year without averaging averages
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_meeting_duration_daily AS
+        SELECT date_trunc('day', d.created_at) AS day,
+               sum(d.duration_minutes) AS total_minutes,
+               min(d.duration_minutes) AS min_minutes,
+               max(d.duration_minutes) AS max_minutes,
+               count(*) AS meeting_count
+        FROM (
+            SELECT m.created_at,
+                   extract(epoch FROM max(ts.timestamp) - min(ts.timestamp)) / 60.0 AS duration_minutes
+            FROM meetings m
+            JOIN transcript_segments ts ON ts.session_id = m.unique_session_id
+            GROUP BY m.unique_session_id, m.created_at
+        ) d
+        GROUP BY 1
+    """)
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_meeting_duration_daily_day ON mv_meeting_duration_daily (day)")
+
+
+def downgrade() -> None:
+    """Drop the analytics rollup views."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_meeting_duration_daily")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_meeting_counts_daily")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_user_reg_daily")
+    op.drop_table('analytics_views_refresh')
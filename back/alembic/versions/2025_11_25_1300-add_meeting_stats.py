@@ -0,0 +1,126 @@
+"""add_meeting_stats
+
+Revision ID: meeting_stats_001
+Revises: analytics_mviews_001
+Create Date: 2025-11-25 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from dapmeet.models.meeting_stats import (
+    MESSAGE_TRIGGER,
+    MESSAGE_TRIGGER_FUNCTION,
+    SEGMENT_TRIGGER,
+    SEGMENT_TRIGGER_FUNCTION,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'meeting_stats_001'
+down_revision: Union[str, None] = 'analytics_mviews_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DURATION_VIEW_FROM_SEGMENTS = """
+    CREATE MATERIALIZED VIEW mv_meeting_duration_daily AS
+    SELECT date_trunc('day', d.created_at) AS day,
+           sum(d.duration_minutes) AS total_minutes,
+           min(d.duration_minutes) AS min_minutes,
+           max(d.duration_minutes) AS max_minutes,
+           count(*) AS meeting_count
+    FROM (
+        SELECT m.created_at,
+               extract(epoch FROM max(ts.timestamp) - min(ts.timestamp)) / 60.0 AS duration_minutes
+        FROM meetings m
+        JOIN transcript_segments ts ON ts.session_id = m.unique_session_id
+        GROUP BY m.unique_session_id, m.created_at
+    ) d
+    GROUP BY 1
+"""
+
+DURATION_VIEW_FROM_STATS = """
+    CREATE MATERIALIZED VIEW mv_meeting_duration_daily AS
+    SELECT date_trunc('day', d.created_at) AS day,
+           sum(d.duration_minutes) AS total_minutes,
+           min(d.duration_minutes) AS min_minutes,
+           max(d.duration_minutes) AS max_minutes,
+           count(*) AS meeting_count
+    FROM (
+        SELECT m.created_at,
+               extract(epoch FROM s.last_ts - s.first_ts) / 60.0 AS duration_minutes
+        FROM meetings m
+        JOIN meeting_stats s ON s.session_id = m.unique_session_id
+        WHERE s.first_ts IS NOT NULL
+    ) d
+    GROUP BY 1
+"""
+
+
+def _replace_duration_view(definition: str) -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_meeting_duration_daily")
+    op.execute(definition)
+    op.execute("CREATE UNIQUE INDEX ux_mv_meeting_duration_daily_day ON mv_meeting_duration_daily (day)")
+
+
+def upgrade() -> None:
+    """Per-meeting segment/message aggregates kept current by triggers.
+
+    Inserts update the row incrementally. Deletes, timestamp changes and
+    moves to another meeting re-read only min/max, which the
+    (session_id, timestamp) index answers without scanning the meeting's
+    segments. The triggers are created before
+    the backfill: they lock both tables until commit, so no write can slip in
+    between.
+    """
+    op.create_table(
+        'meeting_stats',
+        sa.Column('session_id', sa.String(), nullable=False),
+        sa.Column('segment_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('first_ts', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_ts', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('message_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_message_ts', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['session_id'], ['meetings.unique_session_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('session_id')
+    )
+
+    op.execute(SEGMENT_TRIGGER_FUNCTION)
+    op.execute(SEGMENT_TRIGGER)
+    op.execute(MESSAGE_TRIGGER_FUNCTION)
+    op.execute(MESSAGE_TRIGGER)
+
+    op.execute("""
+        INSERT INTO meeting_stats (session_id, segment_count, first_ts, last_ts, message_count, last_message_ts)
+        SELECT m.unique_session_id,
+               coalesce(seg.segment_count, 0), seg.first_ts, seg.last_ts,
+               coalesce(msg.message_count, 0), msg.last_message_ts
+        FROM meetings m
+        LEFT JOIN (
+            SELECT session_id, count(*) AS segment_count, min(timestamp) AS first_ts, max(timestamp) AS last_ts
+            FROM transcript_segments
+            GROUP BY session_id
+        ) seg ON seg.session_id = m.unique_session_id
+        LEFT JOIN (
+            SELECT session_id, count(*) AS message_count, max(created_at) AS last_message_ts
+            FROM chat_messages
+            GROUP BY session_id
+        ) msg ON msg.session_id = m.unique_session_id
+        WHERE seg.session_id IS NOT NULL OR msg.session_id IS NOT NULL
+    """)
+
+    # The daily duration rollup no longer needs to aggregate segments
+    _replace_duration_view(DURATION_VIEW_FROM_STATS)
+
+
+def downgrade() -> None:
+    """Drop meeting_stats and its triggers."""
+    _replace_duration_view(DURATION_VIEW_FROM_SEGMENTS)
+    op.execute("DROP TRIGGER IF EXISTS trg_meeting_stats_messages ON chat_messages")
+    op.execute("DROP TRIGGER IF EXISTS trg_meeting_stats_segments ON transcript_segments")
+    op.execute("DROP FUNCTION IF EXISTS meeting_stats_on_message()")
+    op.execute("DROP FUNCTION IF EXISTS meeting_stats_on_segment()")
+    op.drop_table('meeting_stats')
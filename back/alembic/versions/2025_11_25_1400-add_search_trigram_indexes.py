@@ -0,0 +1,54 @@
+"""add_search_trigram_indexes
+
+Revision ID: search_trgm_indexes_001
+Revises: meeting_stats_001
+Create Date: 2025-11-25 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'search_trgm_indexes_001'
+down_revision: Union[str, None] = 'meeting_stats_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, column) searched with ILIKE '%term%' by the admin API
+TRIGRAM_INDEXES = (
+    ('idx_meetings_title_trgm', 'meetings', 'title'),
+    ('idx_meetings_meeting_id_trgm', 'meetings', 'meeting_id'),
+    ('idx_users_name_trgm', 'users', 'name'),
+    ('idx_users_email_trgm', 'users', 'email'),
+)
+
+
+def upgrade() -> None:
+    """Trigram GIN indexes for the admin search filters.
+
+    A btree cannot serve an unanchored ILIKE '%term%', so every search was a
+    sequential scan. gin_trgm_ops indexes answer ILIKE directly for terms of
+    three or more characters; the queries stay unchanged.
+    """
+    connection = op.get_bind()
+    connection.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for index_name, table, column in TRIGRAM_INDEXES:
+            connection.execute(sa.text(f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name}
+                ON {table} USING gin ({column} gin_trgm_ops)
+            """))
+
+
+def downgrade() -> None:
+    """Drop the trigram indexes; the pg_trgm extension is left installed."""
+    connection = op.get_bind()
+
+    with op.get_context().autocommit_block():
+        for index_name, _, _ in reversed(TRIGRAM_INDEXES):
+            connection.execute(sa.text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
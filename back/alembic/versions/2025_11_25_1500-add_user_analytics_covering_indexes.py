@@ -0,0 +1,54 @@
+"""add_user_analytics_covering_indexes
+
+Revision ID: user_analytics_covering_001
+Revises: search_trgm_indexes_001
+Create Date: 2025-11-25 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'user_analytics_covering_001'
+down_revision: Union[str, None] = 'search_trgm_indexes_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Covering indexes for the detailed users analytics query.
+
+    The per-host aggregation reads only meetings.user_id and
+    unique_session_id, and the user page reads id, name and email in
+    created_at order, so both become index-only scans. The users index
+    replaces idx_users_created_at_analytics, which it makes redundant.
+    """
+    connection = op.get_bind()
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        connection.execute(sa.text("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_meetings_user_id_session
+            ON meetings (user_id) INCLUDE (unique_session_id)
+        """))
+        connection.execute(sa.text("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_created_at_covering
+            ON users (created_at DESC) INCLUDE (id, name, email)
+        """))
+        connection.execute(sa.text("DROP INDEX CONCURRENTLY IF EXISTS idx_users_created_at_analytics"))
+
+
+def downgrade() -> None:
+    """Restore the plain users.created_at index and drop the covering ones."""
+    connection = op.get_bind()
+
+    with op.get_context().autocommit_block():
+        connection.execute(sa.text("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_created_at_analytics
+            ON users (created_at)
+        """))
+        connection.execute(sa.text("DROP INDEX CONCURRENTLY IF EXISTS idx_users_created_at_covering"))
+        connection.execute(sa.text("DROP INDEX CONCURRENTLY IF EXISTS idx_meetings_user_id_session"))
@@ -3,9 +3,9 @@
 # с необходимыми параметрами.
 #
 # Ключевая особенность - он динамически добавляет директорию 'src'
-# в PYTHONPATH, что позволяет uvicorn находить модуль приложения 'dapmeet'.
+# в sys.path, что позволяет uvicorn находить модуль приложения 'dapmeet'.
+# uvicorn запускается в этом же процессе, без отдельного интерпретатора.
 
-import subprocess
 import sys
 import os
 
@@ -13,34 +13,29 @@ def main():
     """
     Запускает uvicorn сервер так, как это определено в Dockerfile.
     """
-    # Убедимся, что мы используем python из того же venv, где запущен этот скрипт
-    python_executable = sys.executable
-    uvicorn_path = os.path.join(os.path.dirname(python_executable), 'uvicorn')
-
-    command = [
-        uvicorn_path,
-        "dapmeet.cmd.main:app",
-        "--host", "0.0.0.0",
-        "--port", "8000",
-        "--reload"
-    ]
-
-    print(f"Running command: {' '.join(command)}")
-
-    # Добавляем 'src' в PYTHONPATH, чтобы uvicorn нашел модуль dapmeet
-    env = os.environ.copy()
+    # Добавляем 'src' в sys.path (и в PYTHONPATH для процессов reload),
+    # чтобы uvicorn нашел модуль dapmeet
     src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), 'src'))
-    env['PYTHONPATH'] = f"{src_path}{os.pathsep}{env.get('PYTHONPATH', '')}"
-    
+    sys.path.insert(0, src_path)
+    os.environ['PYTHONPATH'] = f"{src_path}{os.pathsep}{os.environ.get('PYTHONPATH', '')}"
+
     try:
-        # Запускаем uvicorn с обновленным окружением.
-        # Используем Popen, чтобы не заменять текущий процесс и видеть вывод.
-        proc = subprocess.Popen(command, env=env)
-        proc.wait()
-    except FileNotFoundError:
-        print(f"Error: '{command[0]}' not found.")
+        import uvicorn
+    except ImportError:
+        print("Error: 'uvicorn' not found.")
         print("Please make sure uvicorn is installed in your virtual environment.")
         sys.exit(1)
+
+    print("Running uvicorn dapmeet.cmd.main:app --host 0.0.0.0 --port 8000 --reload")
+
+    try:
+        uvicorn.run(
+            "dapmeet.cmd.main:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,
+            reload_dirs=[src_path],
+        )
     except Exception as e:
         print(f"An error occurred: {e}")
         sys.exit(1)
@@ -7,10 +7,11 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-# Load .env file
-from dotenv import load_dotenv
-env_path = Path(__file__).parent / '.env'
-load_dotenv(dotenv_path=env_path)
+# Load .env file only when the environment does not already provide a URL
+if not os.getenv('DATABASE_URL') and not os.getenv('DATABASE_URL_ASYNC'):
+    from dotenv import load_dotenv
+    env_path = Path(__file__).parent / '.env'
+    load_dotenv(dotenv_path=env_path)
 
 # Get DATABASE_URL or convert DATABASE_URL_ASYNC to sync format
 database_url = os.getenv('DATABASE_URL')
@@ -28,7 +29,7 @@ else:
     print("ERROR: Neither DATABASE_URL nor DATABASE_URL_ASYNC found in .env file")
     sys.exit(1)
 
-# Run migrations
+# Run migrations (alembic is imported only once the URL is resolved)
 from alembic.config import Config
 from alembic import command
 
@@ -36,4 +37,3 @@ alembic_cfg = Config("alembic.ini")
 print("Running migrations...")
 command.upgrade(alembic_cfg, "head")
 print("Migrations completed successfully!")
-
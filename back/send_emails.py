@@ -4,7 +4,12 @@
 """
 import csv
 import asyncio
+import logging
+import logging.handlers
+import queue
+import re
 import sys
+from collections import Counter
 from pathlib import Path
 
 # Добавляем src в PYTHONPATH для импорта модулей
@@ -14,16 +19,33 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from dotenv import load_dotenv
 load_dotenv()
 
+from jinja2 import Template
+
 from dapmeet.services.email_service import email_service
 
+# pyarrow необязателен: если он установлен, CSV разбирается и валидируется
+# векторно (в C), иначе используется построчный разбор через модуль csv
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover - зависит от окружения
+    pa = pc = pacsv = None
+
+logger = logging.getLogger("send_emails")
+
 TEMPLATE_PATH = Path(__file__).parent / "dapmeet_reminder_email.html"
 SUBJECT = "Завершите настройку dapmeet"
+# Простая валидация email: один '@', без пробелов, в доменной части есть '.'.
+# Шаблон совместим и с re, и с RE2 (pyarrow), поэтому общий для обоих путей
+EMAIL_CHECK_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+_EMAIL_RE = re.compile(EMAIL_CHECK_PATTERN)
 
 
-def load_email_template(template_path: Path) -> str:
-    """Загружает HTML шаблон письма из файла."""
+def load_email_template(template_path: Path) -> Template:
+    """Загружает и компилирует HTML шаблон письма из файла."""
     try:
-        return template_path.read_text(encoding="utf-8")
+        return Template(template_path.read_text(encoding="utf-8"))
     except FileNotFoundError as exc:
         raise FileNotFoundError(
             f"Не найден HTML шаблон письма по пути: {template_path}"
@@ -34,6 +56,70 @@ def load_email_template(template_path: Path) -> str:
         ) from exc
 
 
+def _read_emails_with_pyarrow(csv_path: str) -> list[str]:
+    """Читает и валидирует колонку "Email" целиком средствами pyarrow."""
+    # Проверяем наличие колонки Email по заголовку: include_columns ниже
+    # иначе упадет с ошибкой pyarrow без списка доступных колонок
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        header = next(csv.reader(f), [])
+    if 'Email' not in header:
+        raise ValueError(f"Колонка 'Email' не найдена в CSV файле. Доступные колонки: {header}")
+    
+    # Разбираем только колонку Email и только как строки: вывод типов по
+    # остальным колонкам (телефоны, id) падает на смешанных значениях
+    table = pacsv.read_csv(
+        csv_path,
+        convert_options=pacsv.ConvertOptions(
+            include_columns=["Email"],
+            column_types={"Email": pa.string()},
+        ),
+    )
+    
+    column = pc.fill_null(pc.utf8_trim_whitespace(table.column("Email")), "")
+    empty = pc.equal(column, "")
+    valid = pc.and_(pc.invert(empty), pc.match_substring_regex(column, EMAIL_CHECK_PATTERN))
+    
+    # Сообщаем только о пропущенных записях. pyarrow пропускает пустые строки
+    # файла, поэтому это порядковый номер записи, а не номер строки
+    for index in pc.indices_nonzero(pc.invert(valid)).to_pylist():
+        record_num = index + 1
+        if empty[index].as_py():
+            logger.warning("⚠️  Запись %d: пустой email, пропущена", record_num)
+        else:
+            logger.warning("⚠️  Запись %d: пропущен невалидный email '%s'", record_num, column[index].as_py())
+    
+    return pc.filter(column, valid).to_pylist()
+
+
+def _read_emails_with_csv(csv_path: str) -> list[str]:
+    """Построчно читает и валидирует колонку "Email" модулем csv."""
+    emails = []
+    
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        # csv.reader отдает строки списками, без создания dict на каждую строку
+        reader = csv.reader(f)
+        header = next(reader, [])
+        
+        # Проверяем наличие колонки Email
+        if 'Email' not in header:
+            raise ValueError(f"Колонка 'Email' не найдена в CSV файле. Доступные колонки: {header}")
+        email_index = header.index('Email')
+        
+        for row_num, row in enumerate(reader, start=2):  # начинаем с 2, так как первая строка - заголовок
+            email = row[email_index].strip() if email_index < len(row) else ''
+            
+            if email:
+                # Простая валидация email
+                if _EMAIL_RE.match(email):
+                    emails.append(email)
+                else:
+                    logger.warning("⚠️  Строка %d: пропущен невалидный email '%s'", row_num, email)
+            else:
+                logger.warning("⚠️  Строка %d: пустой email, пропущена", row_num)
+    
+    return emails
+
+
 def read_emails_from_csv(csv_path: str) -> list[str]:
     """
     Читает email-адреса из CSV файла
@@ -44,29 +130,10 @@ def read_emails_from_csv(csv_path: str) -> list[str]:
     Returns:
         Список email-адресов из колонки "Email"
     """
-    emails = []
-    
     try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            
-            # Проверяем наличие колонки Email
-            if 'Email' not in reader.fieldnames:
-                raise ValueError(f"Колонка 'Email' не найдена в CSV файле. Доступные колонки: {reader.fieldnames}")
-            
-            for row_num, row in enumerate(reader, start=2):  # начинаем с 2, так как первая строка - заголовок
-                email = row.get('Email', '').strip()
-                
-                if email:
-                    # Простая валидация email
-                    if '@' in email and '.' in email.split('@')[1]:
-                        emails.append(email)
-                    else:
-                        print(f"⚠️  Строка {row_num}: пропущен невалидный email '{email}'")
-                else:
-                    print(f"⚠️  Строка {row_num}: пустой email, пропущена")
-        
-        return emails
+        if pacsv is not None:
+            return _read_emails_with_pyarrow(csv_path)
+        return _read_emails_with_csv(csv_path)
     
     except FileNotFoundError:
         raise FileNotFoundError(f"CSV файл не найден: {csv_path}")
@@ -74,23 +141,65 @@ def read_emails_from_csv(csv_path: str) -> list[str]:
         raise Exception(f"Ошибка при чтении CSV файла: {str(e)}")
 
 
+def setup_logging() -> logging.handlers.QueueListener:
+    """
+    Настраивает логирование через очередь: event loop только кладет записи
+    в очередь, а запись в stdout выполняет отдельный поток QueueListener
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
+
+class RateLimiter:
+    """
+    Ограничивает частоту отправки: не более rate писем в секунду.
+    Каждая отправка резервирует свой слот, поэтому остальные задачи не
+    простаивают, как при общей паузе между батчами.
+    """
+    
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
 async def send_email_to_address(
     email: str,
-    semaphore: asyncio.Semaphore,
+    rate_limiter: RateLimiter,
     subject: str,
     content: str,
 ) -> tuple[str, bool]:
     """
-    Отправляет email одному адресату с использованием семафора для контроля параллелизма
+    Отправляет email одному адресату с учетом ограничения частоты отправки
     
     Args:
         email: Email адрес получателя
-        semaphore: Семафор для ограничения параллельных запросов
+        rate_limiter: Ограничитель частоты отправки
         
     Returns:
         Кортеж (email, success) где success - True если письмо отправлено успешно
     """
-    async with semaphore:
+    async with rate_limiter:
         try:
             success = await email_service.send_simple_email(
                 to_email=email,
@@ -100,7 +209,7 @@ async def send_email_to_address(
             )
             return (email, success)
         except Exception as e:
-            print(f"❌ Ошибка при отправке письма на {email}: {str(e)}")
+            logger.error("❌ Ошибка при отправке письма на %s: %s", email, e)
             return (email, False)
 
 
@@ -110,112 +219,116 @@ async def send_emails_async(
     subject: str,
     content: str,
     max_concurrent: int = 5,
-    delay_between_batches: float = 1.0,
+    max_per_second: float = 5.0,
 ):
     """
-    Асинхронно отправляет письма с контролем параллелизма через семафор
+    Асинхронно отправляет письма пулом из max_concurrent воркеров,
+    которые разбирают адреса из общей очереди
     
     Args:
         emails: Список email-адресов
         max_concurrent: Максимальное количество параллельных отправок
-        delay_between_batches: Задержка между батчами в секундах
+        max_per_second: Максимальное количество отправок в секунду
     """
     total = len(emails)
-    successful = 0
-    failed = 0
+    stats = Counter()
     
-    print(f"📧 Найдено {total} email-адресов для отправки")
-    print(f"⚙️  Максимальное количество параллельных отправок: {max_concurrent}\n")
+    logger.info("📧 Найдено %d email-адресов для отправки", total)
+    logger.info("⚙️  Максимальное количество параллельных отправок: %d\n", max_concurrent)
     
-    # Создаем семафор для ограничения параллельных запросов
-    semaphore = asyncio.Semaphore(max_concurrent)
+    rate_limiter = RateLimiter(max_per_second)
     
     # Разбиваем на батчи для вывода прогресса
     batch_size = max_concurrent
     total_batches = (total + batch_size - 1) // batch_size
     
-    # Создаем все задачи сразу, но семафор ограничит параллельное выполнение
-    tasks = [
-        asyncio.create_task(
-            send_email_to_address(email, semaphore, subject, content)
-        )
-        for email in emails
-    ]
+    # Очередь адресов: задач создается max_concurrent, а не по одной на письмо
+    email_queue: asyncio.Queue[str] = asyncio.Queue()
+    for email in emails:
+        email_queue.put_nowait(email)
     
-    # Обрабатываем результаты по мере завершения задач
-    batch_num = 0
     completed = 0
     
-    # Используем as_completed для обработки результатов по мере их готовности
-    for task in asyncio.as_completed(tasks):
-        try:
-            email, success = await task
-            completed += 1
-            
-            if success:
-                print(f"✅ [{completed}/{total}] {email}: отправлено")
-                successful += 1
-            else:
-                print(f"❌ [{completed}/{total}] {email}: не удалось отправить")
-                failed += 1
-            
-            # Выводим информацию о батче при завершении каждого батча
-            if completed % batch_size == 0 or completed == total:
-                batch_num = (completed + batch_size - 1) // batch_size
-                if completed < total:
-                    print(f"📊 Прогресс: батч {batch_num}/{total_batches} завершен ({completed}/{total} писем)")
-                    if delay_between_batches > 0:
-                        print(f"⏳ Пауза {delay_between_batches} секунд...\n")
-                        await asyncio.sleep(delay_between_batches)
-        except Exception as e:
-            completed += 1
-            print(f"❌ [{completed}/{total}] Исключение при обработке: {str(e)}")
-            failed += 1
+    def record_result(email: str, success: bool) -> None:
+        nonlocal completed
+        completed += 1
+        stats[success] += 1
+        
+        if success:
+            logger.info("✅ [%d/%d] %s: отправлено", completed, total, email,
+                        extra={"email": email, "ok": success})
+        else:
+            logger.info("❌ [%d/%d] %s: не удалось отправить", completed, total, email,
+                        extra={"email": email, "ok": success})
+        
+        # Выводим информацию о батче при завершении каждого батча
+        if completed % batch_size == 0 and completed < total:
+            logger.info("📊 Прогресс: батч %d/%d завершен (%d/%d писем)",
+                        completed // batch_size, total_batches, completed, total)
+    
+    async def worker() -> None:
+        while True:
+            try:
+                email = email_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            email, success = await send_email_to_address(email, rate_limiter, subject, content)
+            record_result(email, success)
     
-    print(f"\n{'='*50}")
-    print(f"📊 Итоги:")
-    print(f"✅ Успешно отправлено: {successful}")
-    print(f"❌ Ошибок: {failed}")
-    print(f"📧 Всего обработано: {total}")
-    print(f"{'='*50}")
+    # Каждый воркер держит свое SMTP-соединение на всю рассылку, а не
+    # подключается заново (TLS + логин) для каждого письма
+    workers = min(max_concurrent, total)
+    async with email_service.smtp_pool(workers):
+        await asyncio.gather(*(worker() for _ in range(workers)))
+    
+    logger.info("\n%s", "=" * 50)
+    logger.info("📊 Итоги:")
+    logger.info("✅ Успешно отправлено: %d", stats[True])
+    logger.info("❌ Ошибок: %d", stats[False])
+    logger.info("📧 Всего обработано: %d", total)
+    logger.info("%s", "=" * 50)
 
 
 async def main():
     """
     Главная функция скрипта
     """
+    listener = setup_logging()
+    
     # Определяем путь к CSV файлу
     default_csv = Path("users.csv")
     csv_path = Path(sys.argv[1]) if len(sys.argv) > 1 else default_csv
     
-    print(f"📁 Чтение CSV файла: {csv_path}\n")
+    logger.info("📁 Чтение CSV файла: %s\n", csv_path)
     
     try:
         # Читаем email-адреса из CSV
         emails = read_emails_from_csv(str(csv_path))
         
         if not emails:
-            print("⚠️  Не найдено ни одного валидного email-адреса в CSV файле")
+            logger.warning("⚠️  Не найдено ни одного валидного email-адреса в CSV файле")
             return
 
-        # Загружаем HTML шаблон письма
-        template = load_email_template(TEMPLATE_PATH)
+        # Загружаем шаблон и рендерим его один раз: письмо одинаково для всех
+        # адресатов, поэтому при отправке шаблон повторно не разбирается
+        content = load_email_template(TEMPLATE_PATH).render()
         
         # Отправляем письма асинхронно
         await send_emails_async(
             emails,
             subject=SUBJECT,
-            content=template,
+            content=content,
             max_concurrent=5,
-            delay_between_batches=1.0,
+            max_per_second=5.0,
         )
         
     except Exception as e:
-        print(f"❌ Критическая ошибка: {str(e)}")
+        logger.error("❌ Критическая ошибка: %s", e)
         sys.exit(1)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
     # Запускаем асинхронную функцию
     asyncio.run(main())
-
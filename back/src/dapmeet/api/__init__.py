@@ -1,14 +1,21 @@
+from importlib import import_module
+
 from fastapi import APIRouter
 
-from . import meetings, chat, auth, admin, admin_prompts, user_prompts, whisper, webhook, subscription
+# (module, prefix, tags) for every sub-router, in registration order
+_ROUTES = [
+    ("meetings", "/api/meetings", ["Meetings"]),
+    ("chat", "/api/chat", ["Chat"]),
+    ("auth", "/auth", ["Auth"]),
+    ("subscription", "/api/subscriptions", ["Subscriptions"]),
+    ("admin", "/admin", ["Admin"]),
+    ("admin_prompts", "/admin/prompts", ["Admin Prompts"]),
+    ("user_prompts", "/api/prompts", ["User Prompts"]),
+    ("whisper", "/api/whisper", ["Whisper"]),
+    ("webhook", "/webhook", ["Webhook"]),
+]
 
 api_router = APIRouter()
-api_router.include_router(meetings.router, prefix="/api/meetings", tags=["Meetings"])
-api_router.include_router(chat.router, prefix="/api/chat", tags=["Chat"])
-api_router.include_router(auth.router, prefix="/auth", tags=["Auth"])
-api_router.include_router(subscription.router, prefix="/api/subscriptions", tags=["Subscriptions"])
-api_router.include_router(admin.router, prefix="/admin", tags=["Admin"])
-api_router.include_router(admin_prompts.router, prefix="/admin/prompts", tags=["Admin Prompts"])
-api_router.include_router(user_prompts.router, prefix="/api/prompts", tags=["User Prompts"])
-api_router.include_router(whisper.router, prefix="/api/whisper", tags=["Whisper"])
-api_router.include_router(webhook.router, prefix="/webhook", tags=["Webhook"])
\ No newline at end of file
+for _module_name, _prefix, _tags in _ROUTES:
+    _module = import_module(f".{_module_name}", __package__)
+    api_router.include_router(_module.router, prefix=_prefix, tags=_tags)
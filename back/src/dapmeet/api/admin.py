@@ -1,12 +1,21 @@
-from typing import Any, Dict, List, Optional
-from datetime import datetime, date
+from typing import Any, Dict, Final, List, Literal, Optional
+from datetime import datetime, date, timedelta
+from functools import lru_cache
+import asyncio
+import base64
+import hashlib
+import json
 import logging
+import re
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text, and_, func, select, case, extract
-import asyncio
+from sqlalchemy import ARRAY, JSON, Float, Integer, Numeric, String, any_, bindparam, cast, text, and_, func, select, case, extract, tuple_
+from sqlalchemy.orm import aliased
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
 import time
 from typing import Optional
 
@@ -19,11 +28,18 @@ from dapmeet.services.admin_auth import (
     create_admin_jwt,
 )
 from dapmeet.models.user import User
-from dapmeet.models.meeting import Meeting
+from dapmeet.models.meeting import Meeting, meeting_participants
 from dapmeet.models.segment import TranscriptSegment
+from dapmeet.models.meeting_stats import MeetingStats
 from dapmeet.models.chat_message import ChatMessage
 from dapmeet.models.prompt import Prompt
 from dapmeet.services.subscription import SubscriptionService
+from dapmeet.services.analytics_views import (
+    last_refresh_subquery,
+    mv_meeting_counts_daily,
+    mv_meeting_duration_daily,
+    mv_user_reg_daily,
+)
 from dapmeet.schemas.subscription import (
     SubscriptionUpdate,
     SubscriptionOut,
@@ -97,6 +113,8 @@ class AdminPaginationInfo(BaseModel):
     total_pages: int
     has_next: bool
     has_prev: bool
+    total_is_estimate: bool = False
+    next_cursor: Optional[str] = None
 
 class AdminDetailedMeetingsResponse(BaseModel):
     """Detailed meetings list response"""
@@ -140,41 +158,66 @@ class AdminDetailedUsersResponse(BaseModel):
 # Caching for Dashboard Metrics
 # =====================
 
-# Simple in-memory cache for dashboard metrics (TTL: 60 seconds)
-_metrics_cache = {"data": None, "timestamp": 0, "ttl": 60}
+# In-memory cache for dashboard metrics, keyed by 60-second time bucket
+METRICS_CACHE_TTL = 60
+
+@lru_cache(maxsize=1)
+def _metrics_for_bucket(bucket: int) -> Dict:
+    """Cache slot for one time bucket; entering a new bucket evicts the old slot"""
+    return {}
+
+def current_metrics_slot() -> Dict:
+    """Cache slot for the current time bucket"""
+    return _metrics_for_bucket(int(time.time()) // METRICS_CACHE_TTL)
+
+# Date-filtered analytics metrics share the TTL; slots of past buckets age out of the LRU
+@lru_cache(maxsize=64)
+def _analytics_metrics_for_bucket(start_date: Optional[str], end_date: Optional[str], bucket: int) -> Dict:
+    """Cache slot for one date range in one time bucket"""
+    return {}
 
-def get_cached_metrics() -> Optional[Dict]:
-    """Get cached metrics if still valid"""
-    if _metrics_cache["data"] and (time.time() - _metrics_cache["timestamp"]) < _metrics_cache["ttl"]:
-        return _metrics_cache["data"]
-    return None
+# Table counts for the admin lists share the TTL as well
+@lru_cache(maxsize=128)
+def _count_for_bucket(key: str, bucket: int) -> Dict:
+    """Cache slot for one count in one time bucket"""
+    return {}
 
-def set_cached_metrics(data: Dict):
-    """Cache metrics data"""
-    _metrics_cache["data"] = data
-    _metrics_cache["timestamp"] = time.time()
+async def cached_count(db: AsyncSession, key: str, stmt) -> int:
+    """Scalar count of stmt, cached under key for METRICS_CACHE_TTL seconds"""
+    slot = _count_for_bucket(key, int(time.time()) // METRICS_CACHE_TTL)
+    if "value" not in slot:
+        slot["value"] = await db.scalar(stmt) or 0
+    return slot["value"]
+
+def users_count_key(search: Optional[str]) -> str:
+    """cached_count key for the number of users matching search"""
+    return f"users:{search or ''}"
+
+def current_analytics_metrics_slot(start_date: Optional[str], end_date: Optional[str]) -> Dict:
+    """Cache slot for the date range in the current time bucket"""
+    return _analytics_metrics_for_bucket(start_date, end_date, int(time.time()) // METRICS_CACHE_TTL)
 
 
 # =====================
 # Helper Functions
 # =====================
 
-def validate_date_params(start_date: Optional[str], end_date: Optional[str]) -> tuple[Optional[datetime], Optional[datetime]]:
-    """Validate and convert date parameters"""
-    start_dt = None
-    end_dt = None
-    
-    if start_date:
-        try:
-            start_dt = datetime.fromisoformat(start_date)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid start_date format. Use YYYY-MM-DD")
-    
-    if end_date:
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+def parse_date_param(value: str, name: str) -> datetime:
+    """Parse a YYYY-MM-DD query parameter, rejecting other shapes up front"""
+    if _DATE_RE.match(value):
         try:
-            end_dt = datetime.fromisoformat(end_date)
+            return datetime.fromisoformat(value)
         except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid end_date format. Use YYYY-MM-DD")
+            # Right shape but not a calendar date, e.g. 2025-02-30
+            pass
+    raise HTTPException(status_code=400, detail=f"Invalid {name} format. Use YYYY-MM-DD")
+
+def validate_date_params(start_date: Optional[str], end_date: Optional[str]) -> tuple[Optional[datetime], Optional[datetime]]:
+    """Validate and convert date parameters"""
+    start_dt = parse_date_param(start_date, "start_date") if start_date else None
+    end_dt = parse_date_param(end_date, "end_date") if end_date else None
     
     if start_dt and end_dt and start_dt > end_dt:
         raise HTTPException(status_code=400, detail="start_date must be before end_date")
@@ -187,212 +230,356 @@ def validate_date_params(start_date: Optional[str], end_date: Optional[str]) ->
     
     return start_dt, end_dt
 
-def validate_group_by(group_by: str) -> str:
-    """Validate group_by parameter"""
-    valid_values = ["day", "week", "month", "year"]
-    if group_by not in valid_values:
-        return "day"  # Default fallback
-    return group_by
-
-def get_date_trunc_format(group_by: str) -> str:
-    """Get PostgreSQL DATE_TRUNC format for grouping"""
-    formats = {
-        "day": "day",
-        "week": "week", 
-        "month": "month",
-        "year": "year"
-    }
-    return formats.get(group_by, "day")
+def apply_date_filter(query, column, start_dt: Optional[datetime], end_dt: Optional[datetime]):
+    """Restrict query to rows whose column falls within the optional date range"""
+    if start_dt:
+        query = query.where(column >= start_dt)
+    if end_dt:
+        query = query.where(column <= end_dt)
+    return query
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) wrapper that keeps the statement's bound parameters"""
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+# Below this many rows an exact count is cheap enough to always run
+EXACT_COUNT_THRESHOLD = 10000
+
+async def estimate_total(db: AsyncSession, rows_query, min_exact: int = 0) -> Optional[int]:
+    """
+    Planner row estimate of rows_query for pagination (PostgreSQL only)
+
+    Returns None when the total should be counted exactly instead: for small
+    results, and for results the requested page reaches past (min_exact).
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    plan = (await db.execute(_Explain(rows_query))).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    estimate = int(plan[0]["Plan"]["Plan Rows"])
+    return estimate if estimate > max(EXACT_COUNT_THRESHOLD, min_exact) else None
+
+async def table_estimate(db: AsyncSession, table_name: str, min_exact: int = 0) -> Optional[int]:
+    """
+    Row estimate of a whole table from pg_class.reltuples (PostgreSQL only)
+
+    Returns None under the same conditions as estimate_total, and for tables
+    that have never been analyzed (reltuples is -1).
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    estimate = await db.scalar(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:t)"), {"t": table_name}
+    )
+    return estimate if estimate is not None and estimate > max(EXACT_COUNT_THRESHOLD, min_exact) else None
+
+async def count_rows(db: AsyncSession, rows_query) -> int:
+    """Exact row count of rows_query"""
+    return await db.scalar(select(func.count()).select_from(rows_query.subquery())) or 0
+
+def page_total(rows: List, page: int) -> Optional[int]:
+    """Total from the total_count window column of a page, or None if it must be counted separately"""
+    if rows:
+        return rows[0].total_count
+    return 0 if page == 1 else None
+
+def encode_cursor(created_at: datetime, key: str) -> str:
+    """Opaque keyset cursor for the row (created_at, key)"""
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{key}".encode("utf-8")).decode("ascii")
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Inverse of encode_cursor"""
+    try:
+        created_at, key = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split("|", 1)
+        return datetime.fromisoformat(created_at), key
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def page_flags(page: int, total_pages: int, cursor: Optional[str], next_cursor: Optional[str]) -> tuple[bool, bool]:
+    """
+    (has_next, has_prev) for a page of results
+
+    A cursor page ignores page, so it is neither first nor judged by
+    total_pages; whether more rows follow is known from next_cursor.
+    """
+    if cursor:
+        return next_cursor is not None, True
+    return page < total_pages, page > 1
+
+def apply_keyset(query, ts_column, key_column, cursor: str, descending: bool = True):
+    """
+    Restrict query to rows after the cursor in (ts_column, key_column) order
+
+    The redundant bound on ts_column alone lets a plain index on it serve the seek.
+    """
+    cursor_ts, cursor_key = decode_cursor(cursor)
+    if descending:
+        return query.where(ts_column <= cursor_ts, tuple_(ts_column, key_column) < tuple_(cursor_ts, cursor_key))
+    return query.where(ts_column >= cursor_ts, tuple_(ts_column, key_column) > tuple_(cursor_ts, cursor_key))
+
+# Grouping intervals; FastAPI rejects any other group_by value before the handler runs
+GroupBy = Literal["day", "week", "month", "year"]
+
+# PostgreSQL DATE_TRUNC format for each grouping interval
+GROUP_BY_FORMATS: Final[Dict[str, str]] = {
+    "day": "day",
+    "week": "week",
+    "month": "month",
+    "year": "year"
+}
+
+def truncate_to_bucket(dt: datetime, group_by: str) -> datetime:
+    """Python counterpart of DATE_TRUNC for the supported group_by values"""
+    dt = dt.replace(hour=0, minute=0, second=0, microsecond=0)
+    if group_by == "week":
+        return dt - timedelta(days=dt.weekday())
+    if group_by == "month":
+        return dt.replace(day=1)
+    if group_by == "year":
+        return dt.replace(month=1, day=1)
+    return dt
+
+def next_bucket(dt: datetime, group_by: str) -> datetime:
+    """Start of the bucket following the one that starts at dt"""
+    if group_by == "week":
+        return dt + timedelta(days=7)
+    if group_by == "month":
+        return dt.replace(year=dt.year + 1, month=1) if dt.month == 12 else dt.replace(month=dt.month + 1)
+    if group_by == "year":
+        return dt.replace(year=dt.year + 1)
+    return dt + timedelta(days=1)
+
+def get_bucket_bounds(
+    start_dt: Optional[datetime], end_dt: Optional[datetime], group_by: str
+) -> tuple[Optional[datetime], Optional[datetime]]:
+    """Half-open [lower, upper) range covering every bucket touched by the date range"""
+    lower = truncate_to_bucket(start_dt, group_by) if start_dt else None
+    upper = next_bucket(truncate_to_bucket(end_dt, group_by), group_by) if end_dt else None
+    return lower, upper
+
+def user_counts_subquery():
+    """
+    Meeting and chat message counts per host user
+
+    Message counts come from meeting_stats, so chat_messages is not joined
+    and meetings are not multiplied by their messages.
+    """
+    return (
+        select(
+            Meeting.user_id,
+            func.count(Meeting.unique_session_id).label('meeting_count'),
+            func.coalesce(func.sum(MeetingStats.message_count), 0).label('message_count')
+        )
+        .select_from(Meeting)
+        .join(MeetingStats, Meeting.unique_session_id == MeetingStats.session_id, isouter=True)
+        .group_by(Meeting.user_id)
+        .subquery()
+    )
+
+def user_with_counts_stmt(user_id: str):
+    """One user together with their meeting and message counts, in a single query"""
+    counts_subquery = user_counts_subquery()
+    return (
+        select(
+            User,
+            func.coalesce(counts_subquery.c.meeting_count, 0).label('meeting_count'),
+            func.coalesce(counts_subquery.c.message_count, 0).label('message_count')
+        )
+        .join(counts_subquery, User.id == counts_subquery.c.user_id, isouter=True)
+        .where(User.id == user_id)
+    )
+
+def rounded_minutes(expr):
+    """expr rounded to 2 decimals as a float, with NULL as 0"""
+    return cast(func.round(cast(func.coalesce(expr, 0), Numeric), 2), Float)
+
+def apply_bucket_range(query, column, lower: Optional[datetime], upper: Optional[datetime]):
+    """Restrict query to lower <= column < upper on the raw column so its btree index stays usable"""
+    if lower:
+        query = query.where(column >= lower)
+    if upper:
+        query = query.where(column < upper)
+    return query
+
+async def get_meetings_with_duration_batch(db: AsyncSession, meetings: List[Meeting]) -> List[Dict]:
+    """
+    Add duration, owners, and AI chat interactions to a list of Meeting objects
+    (e.g. from scalars().all()). Host user info is looked up in the batch query.
+    """
+    meeting_lookup = {meeting.unique_session_id: (meeting, None) for meeting in meetings}
+    return await _meetings_with_duration(db, meeting_lookup)
+
+
+async def get_meetings_with_duration_batch_from_rows(db: AsyncSession, rows: List) -> List[Dict]:
+    """
+    Same as get_meetings_with_duration_batch, for (Meeting, User) rows from a JOIN;
+    the joined User is used as the host.
+    """
+    meeting_lookup = {meeting.unique_session_id: (meeting, user) for meeting, user in rows}
+    return await _meetings_with_duration(db, meeting_lookup)
+
+
+def _build_meeting_dict(meeting_obj: Meeting, user_obj: Optional[User], batch_row) -> Optional[Dict]:
+    """Build one meeting response dict from its batch query row; None if it cannot be built"""
+    try:
+        # Duration is None for meetings without segments
+        duration = batch_row.duration_minutes if batch_row is not None else None
+        
+        # Get AI chat count
+        ai_chat_count = (batch_row.ai_chat_count if batch_row is not None else None) or 0
+        
+        # Get participants (owners)
+        participants = list(batch_row.owners or []) if batch_row is not None else []
+        
+        # Build meeting dict with direct attribute access
+        meeting_dict = {
+            "unique_session_id": meeting_obj.unique_session_id,
+            "meeting_id": meeting_obj.meeting_id,
+            "user_id": meeting_obj.user_id,
+            "title": meeting_obj.title,
+            "created_at": meeting_obj.created_at,
+            "duration_minutes": duration,
+            "ai_chat_interactions": ai_chat_count,
+            "owners": participants
+        }
+        
+        # Get host owner info
+        host_owner = None
+        if user_obj:
+            # Use user_obj from JOIN if available
+            host_owner = {
+                "user_id": user_obj.id,
+                "email": user_obj.email,
+                "name": user_obj.name
+            }
+        elif batch_row is not None and batch_row.host_user_id:
+            # Get from batch query
+            host_owner = {
+                "user_id": batch_row.host_user_id,
+                "email": batch_row.host_email,
+                "name": batch_row.host_name
+            }
+        
+        if host_owner:
+            meeting_dict["user_email"] = host_owner["email"]
+            meeting_dict["user_name"] = host_owner["name"]
+            
+            # Add host to owners if not already present (checked in SQL)
+            host_is_owner = batch_row is not None and batch_row.host_is_owner
+            if host_owner["user_id"] and not host_is_owner:
+                meeting_dict["owners"] = [host_owner, *participants]
+        
+        return meeting_dict
+    except Exception as e:
+        # Log error but continue processing
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Error building meeting dict for session %s: %s",
+                         meeting_obj.unique_session_id, e, exc_info=True)
+        return None
 
-async def get_meetings_with_duration_batch(db: AsyncSession, meetings: List) -> List[Dict]:
+
+async def _meetings_with_duration(db: AsyncSession, meeting_lookup: Dict[str, tuple]) -> List[Dict]:
     """
-    Add duration, owners, and AI chat interactions to a list of meetings using batch queries for efficiency.
+    Build meeting dicts for {session_id: (Meeting, User or None)} using batch queries for efficiency.
     This prevents N+1 query problem and reduces database connections.
     """
-    if not meetings:
+    if not meeting_lookup:
         return []
     
-    # Extract session IDs from meetings
-    session_ids = []
-    meeting_lookup = {}
+    session_ids = list(meeting_lookup)
     
-    for meeting in meetings:
-        try:
-            # Handle both Meeting objects and SQLAlchemy Row objects from JOIN
-            if hasattr(meeting, '_mapping') or hasattr(meeting, '_fields'):
-                # SQLAlchemy Row object from JOIN query (Meeting, User)
-                meeting_obj = meeting[0]  # Meeting object
-                user_obj = meeting[1] if len(meeting) > 1 else None  # User object
-            elif isinstance(meeting, tuple):
-                # Regular tuple (Meeting, User)
-                meeting_obj = meeting[0]
-                user_obj = meeting[1] if len(meeting) > 1 else None
-            else:
-                # Direct Meeting object
-                meeting_obj = meeting
-                user_obj = None
-            
-            # Access unique_session_id from Meeting object
-            session_id = meeting_obj.unique_session_id
-                
-            session_ids.append(session_id)
-            meeting_lookup[session_id] = (meeting_obj, user_obj)
-        except Exception as e:
-            # Log error with more details for debugging
-            print(f"Error processing meeting object: {e}")
-            print(f"Meeting type: {type(meeting)}")
-            if hasattr(meeting, '__dict__'):
-                print(f"Meeting attributes: {meeting.__dict__}")
-            continue
-    
-    # Import here to avoid circular dependencies
-    from dapmeet.models.meeting import meeting_participants
-    
-    # Extract unique user_ids for host lookup
-    host_user_ids = set()
-    for meeting in meeting_lookup.values():
-        meeting_obj = meeting[0]
-        if meeting_obj.user_id:
-            host_user_ids.add(meeting_obj.user_id)
-    
-    # Batch query to get duration for all meetings at once
-    duration_query = select(
+    # Per-session aggregates as CTEs, joined onto the meetings and their
+    # hosts, so everything comes back in a single round-trip.
+    # session_ids is bound once as a text[] array (= ANY) instead of IN with
+    # one parameter per id, so the SQL text (and its prepared statement) is
+    # the same whatever the number of meetings
+    session_ids_param = bindparam('session_ids', session_ids, type_=ARRAY(String))
+    
+    # Meeting duration in minutes (first to last segment), rounded server-side
+    duration_seconds = func.extract(
+        'epoch', func.max(TranscriptSegment.timestamp) - func.min(TranscriptSegment.timestamp)
+    )
+    durations = select(
         TranscriptSegment.session_id,
-        func.min(TranscriptSegment.timestamp).label('first_timestamp'),
-        func.max(TranscriptSegment.timestamp).label('last_timestamp')
+        cast(func.round(cast(duration_seconds / 60.0, Numeric), 2), Float).label('duration_minutes')
     ).where(
-        TranscriptSegment.session_id.in_(session_ids)
-    ).group_by(TranscriptSegment.session_id)
+        TranscriptSegment.session_id == any_(session_ids_param)
+    ).group_by(TranscriptSegment.session_id).cte('durations')
     
-    # Batch query to get AI chat message counts
-    ai_chat_query = select(
+    # AI chat message counts
+    ai_chats = select(
         ChatMessage.session_id,
         func.count(ChatMessage.id).label('ai_chat_count')
     ).where(
         and_(
-            ChatMessage.session_id.in_(session_ids),
+            ChatMessage.session_id == any_(session_ids_param),
             ChatMessage.sender == 'ai'
         )
-    ).group_by(ChatMessage.session_id)
+    ).group_by(ChatMessage.session_id).cte('ai_chats')
     
-    # Batch query to get meeting participants (owners)
-    participants_query = select(
+    # Meeting participants (owners), aggregated into one JSON array per session,
+    # plus whether the meeting host is among them
+    owner_meeting = aliased(Meeting)
+    owners = select(
         meeting_participants.c.session_id,
-        User.id.label('participant_user_id'),
-        User.email.label('participant_email'),
-        User.name.label('participant_name')
+        func.json_agg(
+            func.json_build_object('user_id', User.id, 'email', User.email, 'name', User.name),
+            type_=JSON
+        ).label('owners'),
+        func.bool_or(meeting_participants.c.user_id == owner_meeting.user_id).label('host_is_owner')
     ).join(
         User, meeting_participants.c.user_id == User.id
+    ).join(
+        owner_meeting, owner_meeting.unique_session_id == meeting_participants.c.session_id
     ).where(
-        meeting_participants.c.session_id.in_(session_ids)
+        meeting_participants.c.session_id == any_(session_ids_param)
+    ).group_by(meeting_participants.c.session_id).cte('owners')
+    
+    batch_query = select(
+        Meeting.unique_session_id.label('session_id'),
+        durations.c.duration_minutes,
+        ai_chats.c.ai_chat_count,
+        owners.c.owners,
+        owners.c.host_is_owner
+    ).select_from(Meeting).outerjoin(
+        durations, durations.c.session_id == Meeting.unique_session_id
+    ).outerjoin(
+        ai_chats, ai_chats.c.session_id == Meeting.unique_session_id
+    ).outerjoin(
+        owners, owners.c.session_id == Meeting.unique_session_id
+    ).where(
+        Meeting.unique_session_id == any_(session_ids_param)
     )
     
-    # Batch query to get host users (meeting creators)
-    host_users_lookup = {}
-    if host_user_ids:
-        host_users_query = select(
-            User.id,
-            User.email,
-            User.name
-        ).where(
-            User.id.in_(host_user_ids)
+    # Host users (meeting creators), unless every caller row already carries one
+    if any(user_obj is None for _, user_obj in meeting_lookup.values()):
+        host = aliased(User)
+        batch_query = batch_query.add_columns(
+            host.id.label('host_user_id'),
+            host.email.label('host_email'),
+            host.name.label('host_name')
+        ).outerjoin(
+            host, host.id == Meeting.user_id
         )
-        host_users_result = await db.execute(host_users_query)
-        host_users_lookup = {row.id: {"user_id": row.id, "email": row.email, "name": row.name} for row in host_users_result.all()}
-    
-    # Execute remaining batch queries
-    duration_result = await db.execute(duration_query)
-    ai_chat_result = await db.execute(ai_chat_query)
-    participants_result = await db.execute(participants_query)
-    
-    # Build lookup dictionaries
-    duration_data = {row.session_id: row for row in duration_result.all()}
-    ai_chat_data = {row.session_id: row.ai_chat_count for row in ai_chat_result.all()}
-    
-    # Group participants by session_id
-    participants_by_session = {}
-    for row in participants_result.all():
-        session_id = row.session_id
-        if session_id not in participants_by_session:
-            participants_by_session[session_id] = []
-        participants_by_session[session_id].append({
-            "user_id": row.participant_user_id,
-            "email": row.participant_email,
-            "name": row.participant_name
-        })
-    
-    # Build response with all data
-    meetings_with_duration = []
-    
-    for session_id in session_ids:
-        try:
-            meeting_obj, user_obj = meeting_lookup[session_id]
-            
-            # Calculate duration - handle cases where segments might exist but calculation fails
-            duration = None
-            if session_id in duration_data:
-                timestamps = duration_data[session_id]
-                if timestamps.first_timestamp and timestamps.last_timestamp:
-                    try:
-                        duration_seconds = (timestamps.last_timestamp - timestamps.first_timestamp).total_seconds()
-                        if duration_seconds >= 0:  # Ensure non-negative duration
-                            duration = round(duration_seconds / 60.0, 2)
-                        else:
-                            duration = 0.0
-                    except Exception as e:
-                        print(f"Error calculating duration for session {session_id}: {e}")
-                        duration = None
-            
-            # Get AI chat count
-            ai_chat_count = ai_chat_data.get(session_id, 0)
-            
-            # Get participants (owners)
-            participants = participants_by_session.get(session_id, [])
-            
-            # Build meeting dict with direct attribute access
-            meeting_dict = {
-                "unique_session_id": meeting_obj.unique_session_id,
-                "meeting_id": meeting_obj.meeting_id,
-                "user_id": meeting_obj.user_id,
-                "title": meeting_obj.title,
-                "created_at": meeting_obj.created_at,
-                "duration_minutes": duration,
-                "ai_chat_interactions": ai_chat_count,
-                "owners": participants if participants else []
-            }
-            
-            # Get host owner info
-            host_owner = None
-            if user_obj:
-                # Use user_obj from JOIN if available
-                meeting_dict.update({
-                    "user_email": user_obj.email,
-                    "user_name": user_obj.name
-                })
-                host_owner = {
-                    "user_id": user_obj.id,
-                    "email": user_obj.email,
-                    "name": user_obj.name
-                }
-            elif meeting_obj.user_id in host_users_lookup:
-                # Get from batch query lookup
-                host_owner = host_users_lookup[meeting_obj.user_id]
-                meeting_dict.update({
-                    "user_email": host_owner.get("email"),
-                    "user_name": host_owner.get("name")
-                })
-            
-            # Add host to owners if not already present
-            if host_owner and host_owner.get("user_id"):
-                host_user_id = host_owner.get("user_id")
-                if not any(p.get("user_id") == host_user_id for p in meeting_dict["owners"]):
-                    meeting_dict["owners"].insert(0, host_owner)
-            
-            meetings_with_duration.append(meeting_dict)
-        except Exception as e:
-            # Log error but continue processing
-            print(f"Error building meeting dict for session {session_id}: {e}")
-            continue
+    
+    batch_result = await db.execute(batch_query)
+    batch_data = {row.session_id: row for row in batch_result.all()}
+    
+    # Build response with all data (meetings that fail to build are skipped)
+    batch_get = batch_data.get
+    meetings_with_duration = [
+        meeting_dict
+        for session_id, (meeting_obj, user_obj) in meeting_lookup.items()
+        if (meeting_dict := _build_meeting_dict(meeting_obj, user_obj, batch_get(session_id))) is not None
+    ]
     
     return meetings_with_duration
 
@@ -430,67 +617,106 @@ def admin_logout(_: Dict[str, Any] = Depends(get_current_admin)):
 # =====================
 
 
+# Dashboard metrics queries, built once at import time so SQLAlchemy's
+# compiled cache (and asyncpg's prepared statements) are hit on every request.
+# pg_class.reltuples gives approximate row counts (kept current by VACUUM /
+# ANALYZE) without scanning large tables; -1 means never analyzed.
+_TABLE_ESTIMATES_QUERY = text("""
+    SELECT relname, GREATEST(reltuples, 0)::bigint AS estimate
+    FROM pg_class
+    WHERE relnamespace = 'public'::regnamespace
+      AND relname = ANY(ARRAY['users', 'meetings', 'chat_messages'])
+""")
+
+# Prompts is small, so exact counts are cheap
+_PROMPTS_COUNTS_QUERY = select(
+    func.count(case((Prompt.prompt_type == "admin", 1))).label('admin_prompts'),
+    func.count(case((Prompt.prompt_type == "user", 1))).label('user_prompts')
+)
+
+# Exact counts, used when PostgreSQL statistics are not available
+_EXACT_COUNTS_QUERY = select(
+    select(func.count(User.id)).scalar_subquery().label('users'),
+    select(func.count(Meeting.unique_session_id)).scalar_subquery().label('meetings'),
+    select(func.count(Prompt.id)).where(Prompt.prompt_type == "admin").scalar_subquery().label('admin_prompts'),
+    select(func.count(Prompt.id)).where(Prompt.prompt_type == "user").scalar_subquery().label('user_prompts')
+)
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches etag
+
+    Uses the weak comparison If-None-Match calls for: the header may list
+    several tags or be "*", and proxies that compress responses hand back
+    the tag with a W/ prefix.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+# Single-flight guard: when the cache expires, only one request recomputes
+_metrics_lock = asyncio.Lock()
+_analytics_metrics_lock = asyncio.Lock()
+
+
 @router.get("/dashboard/metrics")
-async def dashboard_metrics(_: Dict[str, Any] = Depends(get_current_admin), db: AsyncSession = Depends(get_async_db)):
+async def dashboard_metrics(request: Request, _: Dict[str, Any] = Depends(get_current_admin), db: AsyncSession = Depends(get_async_db)):
     """
     Ultra-fast dashboard metrics using PostgreSQL table statistics and caching.
     This avoids expensive COUNT(*) operations on large tables.
+    The cached response is serialized once and served with an ETag, so
+    polling clients get 304 Not Modified until the metrics change.
     """
     # Check cache first
-    cached_data = get_cached_metrics()
-    if cached_data:
-        return cached_data
+    cache_slot = current_metrics_slot()
+    if "data" not in cache_slot:
+        async with _metrics_lock:
+            # Another request may have filled the cache while we waited
+            cache_slot = current_metrics_slot()
+            if "data" not in cache_slot:
+                data = await compute_dashboard_metrics(db)
+                body = json.dumps(data, separators=(",", ":")).encode("utf-8")
+                cache_slot["body"] = body
+                cache_slot["etag"] = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+                cache_slot["data"] = data
+    
+    headers = {"ETag": cache_slot["etag"]}
+    if etag_matches(request.headers.get("if-none-match"), cache_slot["etag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=cache_slot["body"], media_type="application/json", headers=headers)
+
+
+async def compute_dashboard_metrics(db: AsyncSession) -> Dict:
+    """Compute dashboard metrics, falling back to exact counts if statistics fail"""
     try:
-        # Use PostgreSQL's pg_stat_user_tables for approximate counts (much faster)
-        # This gives us table statistics without scanning the entire table
-        pg_stats_query = text("""
-            SELECT 
-                COALESCE((SELECT n_tup_ins - n_tup_del FROM pg_stat_user_tables WHERE relname = 'users'), 0) as users_count,
-                COALESCE((SELECT n_tup_ins - n_tup_del FROM pg_stat_user_tables WHERE relname = 'meetings'), 0) as meetings_count,
-                COALESCE((SELECT n_tup_ins - n_tup_del FROM pg_stat_user_tables WHERE relname = 'chat_messages'), 0) as chat_messages_count
-        """)
-        
         # Execute the fast statistics query
-        stats_result = await db.execute(pg_stats_query)
-        stats = stats_result.first()
-        
-        # For smaller tables (prompts), we can still use exact counts since they're small
-        prompts_query = select(
-            func.count(case((Prompt.prompt_type == "admin", 1))).label('admin_prompts'),
-            func.count(case((Prompt.prompt_type == "user", 1))).label('user_prompts')
-        )
+        estimates_result = await db.execute(_TABLE_ESTIMATES_QUERY)
+        estimates = {row.relname: row.estimate for row in estimates_result.all()}
         
-        prompts_result = await db.execute(prompts_query)
+        prompts_result = await db.execute(_PROMPTS_COUNTS_QUERY)
         prompts = prompts_result.first()
         
-        # If pg_stat_user_tables returns 0 (stats not available), fall back to exact counts for critical tables
-        users_count = stats.users_count if stats.users_count > 0 else await db.scalar(select(func.count(User.id)))
-        meetings_count = stats.meetings_count if stats.meetings_count > 0 else await db.scalar(select(func.count(Meeting.unique_session_id)))
+        # If the estimate is 0 (table not analyzed yet), fall back to exact counts for critical tables
+        users_count = estimates.get("users") or await db.scalar(select(func.count(User.id)))
+        meetings_count = estimates.get("meetings") or await db.scalar(select(func.count(Meeting.unique_session_id)))
         
-        result_data = {
+        return {
             "users": users_count or 0,
             "meetings": meetings_count or 0,
-            "chat_messages": stats.chat_messages_count or 0,
+            "chat_messages": estimates.get("chat_messages") or 0,
             "admin_prompts": prompts.admin_prompts or 0,
             "user_prompts": prompts.user_prompts or 0,
         }
         
-        # Cache the result
-        set_cached_metrics(result_data)
-        return result_data
-        
     except Exception as e:
         # Fallback to exact counts if PostgreSQL stats are not available
-        print(f"Stats query failed, falling back to exact counts: {e}")
+        logger.debug("Stats query failed, falling back to exact counts: %s", e)
         
-        # Parallel execution of smaller counts for better performance
-        
-        users_count, meetings_count, admin_prompts, user_prompts = await asyncio.gather(
-            db.scalar(select(func.count(User.id))),
-            db.scalar(select(func.count(Meeting.unique_session_id))),
-            db.scalar(select(func.count(Prompt.id)).where(Prompt.prompt_type == "admin")),
-            db.scalar(select(func.count(Prompt.id)).where(Prompt.prompt_type == "user"))
-        )
+        # All exact counts in one statement (one round-trip)
+        counts = (await db.execute(_EXACT_COUNTS_QUERY)).one()
+        users_count, meetings_count, admin_prompts, user_prompts = counts
         
         # For chat messages, use approximate count if needed
         try:
@@ -500,35 +726,41 @@ async def dashboard_metrics(_: Dict[str, Any] = Depends(get_current_admin), db:
             # Fallback: exact count for chat messages (smaller table)
             messages_count = await db.scalar(select(func.count(ChatMessage.id))) or 0
         
-        fallback_data = {
+        return {
             "users": users_count or 0,
             "meetings": meetings_count or 0,
             "chat_messages": messages_count,
             "admin_prompts": admin_prompts or 0,
             "user_prompts": user_prompts or 0,
         }
-        
-        # Cache the fallback result too
-        set_cached_metrics(fallback_data)
-        return fallback_data
 
 
-@router.get("/dashboard/activity-feed")
+@router.get("/dashboard/activity-feed", response_class=ORJSONResponse)
 async def dashboard_activity(_: Dict[str, Any] = Depends(get_current_admin), db: AsyncSession = Depends(get_async_db)):
     meetings_result = await db.execute(
-        select(Meeting).order_by(Meeting.created_at.desc()).limit(10)
+        select(Meeting, User).join(User, Meeting.user_id == User.id)
+        .order_by(Meeting.created_at.desc()).limit(10)
     )
-    latest_meetings = meetings_result.scalars().all()
+    latest_meetings = meetings_result.all()
     
+    # Only the columns the feed returns (covered by idx_transcript_segments_created_at)
     segments_result = await db.execute(
-        select(TranscriptSegment).order_by(TranscriptSegment.created_at.desc()).limit(10)
+        select(
+            TranscriptSegment.id,
+            TranscriptSegment.session_id,
+            TranscriptSegment.speaker_username,
+            TranscriptSegment.timestamp,
+            TranscriptSegment.created_at
+        ).order_by(TranscriptSegment.created_at.desc()).limit(10)
     )
-    latest_segments = segments_result.scalars().all()
+    latest_segments = segments_result.all()
     
     # Add duration to meetings
-    meetings_with_duration = await get_meetings_with_duration_batch(db, latest_meetings)
+    meetings_with_duration = await get_meetings_with_duration_batch_from_rows(db, latest_meetings)
     
-    return {
+    # Returned as ORJSONResponse directly so datetimes are encoded by orjson
+    # instead of being walked by jsonable_encoder first
+    return ORJSONResponse({
         "recent_meetings": meetings_with_duration,
         "recent_segments": [
             {
@@ -540,7 +772,7 @@ async def dashboard_activity(_: Dict[str, Any] = Depends(get_current_admin), db:
             }
             for s in latest_segments
         ],
-    }
+    })
 
 
 @router.get("/dashboard/system-health")
@@ -573,11 +805,30 @@ def metrics_system_performance(_: Dict[str, Any] = Depends(get_current_admin)):
 # Analytics Endpoints
 # =====================
 
+async def _daily_counts_series(db: AsyncSession, view, date_trunc_format: str, lower: Optional[datetime], upper: Optional[datetime]):
+    """Re-bucket a daily count rollup; returns (data points, total, view refresh time)"""
+    bucket = func.date_trunc(date_trunc_format, view.c.day)
+    # Format bucket dates in SQL so rows carry ready-to-send strings
+    query = select(func.to_char(bucket, 'YYYY-MM-DD').label('date'), func.sum(view.c.count).label('count'))
+    query = apply_bucket_range(query, view.c.day, lower, upper)
+    query = query.group_by(bucket).order_by(bucket)
+    data_points = (await db.execute(query)).all()
+    
+    total_query = select(
+        func.sum(view.c.count).label('total'),
+        last_refresh_subquery().label('refreshed_at')
+    )
+    total_query = apply_bucket_range(total_query, view.c.day, lower, upper)
+    totals = (await db.execute(total_query)).one()
+    
+    return data_points, int(totals.total or 0), totals.refreshed_at
+
+
 @router.get("/analytics/users/registrations", response_model=AdminAnalyticsResponse)
 async def analytics_user_registrations(
     start_date: Optional[str] = Query(None, description="Start date in YYYY-MM-DD format"),
     end_date: Optional[str] = Query(None, description="End date in YYYY-MM-DD format"),
-    group_by: str = Query("day", description="Grouping interval: day, week, month, year"),
+    group_by: GroupBy = Query("day", description="Grouping interval: day, week, month, year"),
     _: Dict[str, Any] = Depends(get_current_admin),
     db: AsyncSession = Depends(get_async_db)
 ):
@@ -585,41 +836,19 @@ async def analytics_user_registrations(
     
     # Validate parameters
     start_dt, end_dt = validate_date_params(start_date, end_date)
-    group_by = validate_group_by(group_by)
-    date_trunc_format = get_date_trunc_format(group_by)
+    date_trunc_format = GROUP_BY_FORMATS[group_by]
+    lower, upper = get_bucket_bounds(start_dt, end_dt, group_by)
     
-    # Build query
-    query = select(
-        func.date_trunc(date_trunc_format, User.created_at).label('date'),
-        func.count(User.id).label('count')
+    # Read from the daily registrations rollup
+    data_points, total_registrations, refreshed_at = await _daily_counts_series(
+        db, mv_user_reg_daily, date_trunc_format, lower, upper
     )
     
-    # Apply date filters
-    if start_dt:
-        query = query.where(User.created_at >= start_dt)
-    if end_dt:
-        query = query.where(User.created_at <= end_dt)
-    
-    query = query.group_by(func.date_trunc(date_trunc_format, User.created_at)).order_by('date')
-    
-    # Execute query
-    result = await db.execute(query)
-    data_points = result.all()
-    
-    # Get total registrations for metadata
-    total_query = select(func.count(User.id))
-    if start_dt:
-        total_query = total_query.where(User.created_at >= start_dt)
-    if end_dt:
-        total_query = total_query.where(User.created_at <= end_dt)
-    
-    total_registrations = await db.scalar(total_query)
-    
     # Format response
     data = [
         AdminAnalyticsDataPoint(
-            date=row.date.strftime('%Y-%m-%d'),
-            count=row.count
+            date=row.date,
+            count=int(row.count)
         )
         for row in data_points
     ]
@@ -628,7 +857,8 @@ async def analytics_user_registrations(
         total_registrations=total_registrations,
         start_date=start_date,
         end_date=end_date,
-        group_by=group_by
+        group_by=group_by,
+        generated_at=refreshed_at.isoformat() if refreshed_at else None
     )
     
     return AdminAnalyticsResponse(data=data, metadata=metadata)
@@ -638,7 +868,7 @@ async def analytics_user_registrations(
 async def analytics_meeting_counts(
     start_date: Optional[str] = Query(None, description="Start date in YYYY-MM-DD format"),
     end_date: Optional[str] = Query(None, description="End date in YYYY-MM-DD format"),
-    group_by: str = Query("day", description="Grouping interval: day, week, month, year"),
+    group_by: GroupBy = Query("day", description="Grouping interval: day, week, month, year"),
     _: Dict[str, Any] = Depends(get_current_admin),
     db: AsyncSession = Depends(get_async_db)
 ):
@@ -646,41 +876,19 @@ async def analytics_meeting_counts(
     
     # Validate parameters
     start_dt, end_dt = validate_date_params(start_date, end_date)
-    group_by = validate_group_by(group_by)
-    date_trunc_format = get_date_trunc_format(group_by)
+    date_trunc_format = GROUP_BY_FORMATS[group_by]
+    lower, upper = get_bucket_bounds(start_dt, end_dt, group_by)
     
-    # Build query
-    query = select(
-        func.date_trunc(date_trunc_format, Meeting.created_at).label('date'),
-        func.count(func.distinct(Meeting.unique_session_id)).label('count')
+    # Read from the daily meeting counts rollup
+    data_points, total_meetings, refreshed_at = await _daily_counts_series(
+        db, mv_meeting_counts_daily, date_trunc_format, lower, upper
     )
     
-    # Apply date filters
-    if start_dt:
-        query = query.where(Meeting.created_at >= start_dt)
-    if end_dt:
-        query = query.where(Meeting.created_at <= end_dt)
-    
-    query = query.group_by(func.date_trunc(date_trunc_format, Meeting.created_at)).order_by('date')
-    
-    # Execute query
-    result = await db.execute(query)
-    data_points = result.all()
-    
-    # Get total meetings for metadata
-    total_query = select(func.count(func.distinct(Meeting.unique_session_id)))
-    if start_dt:
-        total_query = total_query.where(Meeting.created_at >= start_dt)
-    if end_dt:
-        total_query = total_query.where(Meeting.created_at <= end_dt)
-    
-    total_meetings = await db.scalar(total_query)
-    
     # Format response
     data = [
         AdminAnalyticsDataPoint(
-            date=row.date.strftime('%Y-%m-%d'),
-            count=row.count
+            date=row.date,
+            count=int(row.count)
         )
         for row in data_points
     ]
@@ -689,7 +897,8 @@ async def analytics_meeting_counts(
         total_meetings=total_meetings,
         start_date=start_date,
         end_date=end_date,
-        group_by=group_by
+        group_by=group_by,
+        generated_at=refreshed_at.isoformat() if refreshed_at else None
     )
     
     return AdminAnalyticsResponse(data=data, metadata=metadata)
@@ -699,7 +908,7 @@ async def analytics_meeting_counts(
 async def analytics_meeting_durations(
     start_date: Optional[str] = Query(None, description="Start date in YYYY-MM-DD format"),
     end_date: Optional[str] = Query(None, description="End date in YYYY-MM-DD format"),
-    group_by: str = Query("day", description="Grouping interval: day, week, month, year"),
+    group_by: GroupBy = Query("day", description="Grouping interval: day, week, month, year"),
     _: Dict[str, Any] = Depends(get_current_admin),
     db: AsyncSession = Depends(get_async_db)
 ):
@@ -707,75 +916,59 @@ async def analytics_meeting_durations(
     
     # Validate parameters
     start_dt, end_dt = validate_date_params(start_date, end_date)
-    group_by = validate_group_by(group_by)
-    date_trunc_format = get_date_trunc_format(group_by)
-    
-    # Build complex query to calculate durations from transcript segments
-    # First, get duration for each meeting by calculating time difference between first and last segment
-    duration_subquery = select(
-        Meeting.unique_session_id,
-        Meeting.created_at,
-        (func.extract('epoch', func.max(TranscriptSegment.timestamp)) - 
-         func.extract('epoch', func.min(TranscriptSegment.timestamp))).label('duration_seconds')
-    ).select_from(
-        Meeting.join(TranscriptSegment, Meeting.unique_session_id == TranscriptSegment.session_id)
-    ).group_by(Meeting.unique_session_id, Meeting.created_at).subquery()
+    date_trunc_format = GROUP_BY_FORMATS[group_by]
+    lower, upper = get_bucket_bounds(start_dt, end_dt, group_by)
     
-    # Now group by date and calculate statistics
+    # Durations come from the daily rollup, which keeps the sum and count of
+    # per-meeting durations (first to last segment) so averages re-bucket exactly
+    durations = mv_meeting_duration_daily.c
+    bucket = func.date_trunc(date_trunc_format, durations.day)
     query = select(
-        func.date_trunc(date_trunc_format, duration_subquery.c.created_at).label('date'),
-        func.avg(duration_subquery.c.duration_seconds / 60.0).label('avg_duration'),
-        func.min(duration_subquery.c.duration_seconds / 60.0).label('min_duration'),
-        func.max(duration_subquery.c.duration_seconds / 60.0).label('max_duration'),
-        func.count(duration_subquery.c.unique_session_id).label('meeting_count')
+        func.to_char(bucket, 'YYYY-MM-DD').label('date'),
+        rounded_minutes(func.sum(durations.total_minutes) / func.sum(durations.meeting_count)).label('avg_duration'),
+        rounded_minutes(func.min(durations.min_minutes)).label('min_duration'),
+        rounded_minutes(func.max(durations.max_minutes)).label('max_duration'),
+        cast(func.sum(durations.meeting_count), Integer).label('meeting_count')
     )
-    
-    # Apply date filters
-    if start_dt:
-        query = query.where(duration_subquery.c.created_at >= start_dt)
-    if end_dt:
-        query = query.where(duration_subquery.c.created_at <= end_dt)
-    
-    query = query.group_by(func.date_trunc(date_trunc_format, duration_subquery.c.created_at)).order_by('date')
+    query = apply_bucket_range(query, durations.day, lower, upper)
+    query = query.group_by(bucket).order_by(bucket)
     
     # Execute query
     result = await db.execute(query)
     data_points = result.all()
     
     # Calculate overall average duration for metadata
-    overall_avg_query = select(
-        func.avg(duration_subquery.c.duration_seconds / 60.0)
+    overall_query = select(
+        rounded_minutes(func.sum(durations.total_minutes) / func.sum(durations.meeting_count)).label('avg_duration'),
+        last_refresh_subquery().label('refreshed_at')
     )
-    if start_dt:
-        overall_avg_query = overall_avg_query.where(duration_subquery.c.created_at >= start_dt)
-    if end_dt:
-        overall_avg_query = overall_avg_query.where(duration_subquery.c.created_at <= end_dt)
+    overall_query = apply_bucket_range(overall_query, durations.day, lower, upper)
+    overall = (await db.execute(overall_query)).one()
     
-    overall_avg_duration = await db.scalar(overall_avg_query)
-    
-    # Format response
+    # Format response; values are rounded and typed by the query
     data = [
-        AdminMeetingDurationDataPoint(
-            date=row.date.strftime('%Y-%m-%d'),
-            avg_duration=round(float(row.avg_duration or 0), 2),
-            min_duration=round(float(row.min_duration or 0), 2),
-            max_duration=round(float(row.max_duration or 0), 2),
+        AdminMeetingDurationDataPoint.model_construct(
+            date=row.date,
+            avg_duration=row.avg_duration,
+            min_duration=row.min_duration,
+            max_duration=row.max_duration,
             meeting_count=row.meeting_count
         )
         for row in data_points
     ]
     
     metadata = AdminAnalyticsMetadata(
-        overall_avg_duration=round(float(overall_avg_duration or 0), 2),
+        overall_avg_duration=overall.avg_duration,
         start_date=start_date,
         end_date=end_date,
-        group_by=group_by
+        group_by=group_by,
+        generated_at=overall.refreshed_at.isoformat() if overall.refreshed_at else None
     )
     
     return AdminMeetingDurationResponse(data=data, metadata=metadata)
 
 
-@router.get("/analytics/meetings/detailed", response_model=AdminDetailedMeetingsResponse)
+@router.get("/analytics/meetings/detailed", response_model=AdminDetailedMeetingsResponse, response_class=ORJSONResponse)
 async def analytics_meetings_detailed(
     start_date: Optional[str] = Query(None, description="Filter by meeting creation date (start)"),
     end_date: Optional[str] = Query(None, description="Filter by meeting creation date (end)"),
@@ -785,6 +978,8 @@ async def analytics_meetings_detailed(
     sort_by: str = Query("created_at", description="Sort field: created_at, duration, participants"),
     sort_order: str = Query("desc", description="Sort direction: asc, desc"),
     all: bool = Query(False, description="Return all meetings without pagination"),
+    exact_total: bool = Query(False, description="Count the total exactly instead of estimating it"),
+    cursor: Optional[str] = Query(None, description="pagination.next_cursor of the previous page (created_at sort only)"),
     _: Dict[str, Any] = Depends(get_current_admin),
     db: AsyncSession = Depends(get_async_db)
 ):
@@ -801,47 +996,25 @@ async def analytics_meetings_detailed(
     if sort_order not in ["asc", "desc"]:
         sort_order = "desc"
     
-    # Import here to avoid circular dependencies
-    from dapmeet.models.meeting import meeting_participants
+    # Keyset pagination is available for the created_at order
+    keyset = sort_by == "created_at" and not all
+    if cursor and not keyset:
+        raise HTTPException(status_code=400, detail="cursor requires sort_by=created_at without all")
     
     # Build complex query with all required data
-    # Subquery for participant counts - use meeting_participants table
-    # Count distinct user_ids per session
-    participant_subquery = select(
-        meeting_participants.c.session_id.label('unique_session_id'),
-        func.count(func.distinct(meeting_participants.c.user_id)).label('participant_count')
-    ).group_by(meeting_participants.c.session_id).subquery()
-    
-    # Subquery for segment counts
-    segment_subquery = select(
-        Meeting.unique_session_id,
-        func.count(TranscriptSegment.id).label('segments_count')
-    ).select_from(
-        Meeting
-    ).join(
-        TranscriptSegment, Meeting.unique_session_id == TranscriptSegment.session_id, isouter=True
-    ).group_by(Meeting.unique_session_id).subquery()
+    # Participant count per meeting as a correlated subquery, so it is
+    # computed by primary-key lookups for the rows of the page only instead
+    # of aggregating the whole meeting_participants table.
+    # (session_id, user_id) is the primary key, so user_ids are already distinct per session
+    participant_count = select(
+        func.count(meeting_participants.c.user_id)
+    ).where(
+        meeting_participants.c.session_id == Meeting.unique_session_id
+    ).correlate(Meeting).scalar_subquery()
     
-    # Subquery for chat message counts
-    message_subquery = select(
-        Meeting.unique_session_id,
-        func.count(ChatMessage.id).label('messages_count')
-    ).select_from(
-        Meeting
-    ).join(
-        ChatMessage, Meeting.unique_session_id == ChatMessage.session_id, isouter=True
-    ).group_by(Meeting.unique_session_id).subquery()
-    
-    # Subquery for duration calculation
-    duration_subquery = select(
-        Meeting.unique_session_id,
-        ((func.extract('epoch', func.max(TranscriptSegment.timestamp)) - 
-          func.extract('epoch', func.min(TranscriptSegment.timestamp))) / 60.0).label('duration_minutes')
-    ).select_from(
-        Meeting
-    ).join(
-        TranscriptSegment, Meeting.unique_session_id == TranscriptSegment.session_id, isouter=True
-    ).group_by(Meeting.unique_session_id).subquery()
+    # Segment/message counts and durations come from meeting_stats, which
+    # triggers keep current; meetings with neither have no row there
+    duration_minutes = func.extract('epoch', MeetingStats.last_ts - MeetingStats.first_ts) / 60.0
     
     # Main query
     base_query = select(
@@ -852,29 +1025,20 @@ async def analytics_meetings_detailed(
         Meeting.user_id,
         User.name.label('host_user_name'),
         User.email.label('host_user_email'),
-        func.coalesce(participant_subquery.c.participant_count, 0).label('participant_count'),
-        func.coalesce(segment_subquery.c.segments_count, 0).label('speech_segments_count'),
-        func.coalesce(message_subquery.c.messages_count, 0).label('chat_messages_count'),
-        func.coalesce(duration_subquery.c.duration_minutes, 0).label('duration_minutes')
+        participant_count.label('participant_count'),
+        func.coalesce(MeetingStats.segment_count, 0).label('speech_segments_count'),
+        func.coalesce(MeetingStats.message_count, 0).label('chat_messages_count'),
+        rounded_minutes(duration_minutes).label('duration_minutes')
     ).select_from(
         Meeting
     ).join(
         User, Meeting.user_id == User.id
     ).join(
-        participant_subquery, Meeting.unique_session_id == participant_subquery.c.unique_session_id, isouter=True
-    ).join(
-        segment_subquery, Meeting.unique_session_id == segment_subquery.c.unique_session_id, isouter=True
-    ).join(
-        message_subquery, Meeting.unique_session_id == message_subquery.c.unique_session_id, isouter=True
-    ).join(
-        duration_subquery, Meeting.unique_session_id == duration_subquery.c.unique_session_id, isouter=True
+        MeetingStats, Meeting.unique_session_id == MeetingStats.session_id, isouter=True
     )
     
     # Apply filters
-    if start_dt:
-        base_query = base_query.where(Meeting.created_at >= start_dt)
-    if end_dt:
-        base_query = base_query.where(Meeting.created_at <= end_dt)
+    base_query = apply_date_filter(base_query, Meeting.created_at, start_dt, end_dt)
     if search:
         base_query = base_query.where(
             (Meeting.title.ilike(f"%{search}%")) | 
@@ -883,25 +1047,25 @@ async def analytics_meetings_detailed(
     
     # Get total count for pagination (simplified to avoid complex subquery)
     # Count meetings directly with same filters
-    count_query = select(func.count(Meeting.unique_session_id)).select_from(Meeting)
-    if start_dt:
-        count_query = count_query.where(Meeting.created_at >= start_dt)
-    if end_dt:
-        count_query = count_query.where(Meeting.created_at <= end_dt)
+    count_query = select(Meeting.unique_session_id)
+    count_query = apply_date_filter(count_query, Meeting.created_at, start_dt, end_dt)
     if search:
         count_query = count_query.where(
             (Meeting.title.ilike(f"%{search}%")) | 
             (Meeting.meeting_id.ilike(f"%{search}%"))
         )
-    total = await db.scalar(count_query)
+    total = None
+    if not (exact_total or all):
+        total = await estimate_total(db, count_query, min_exact=2 * page * limit)
+    total_is_estimate = total is not None
     
     # Apply sorting
     if sort_by == "created_at":
         sort_column = Meeting.created_at
     elif sort_by == "duration":
-        sort_column = duration_subquery.c.duration_minutes
+        sort_column = duration_minutes
     elif sort_by == "participants":
-        sort_column = participant_subquery.c.participant_count
+        sort_column = participant_count
     else:
         sort_column = Meeting.created_at
     
@@ -909,11 +1073,24 @@ async def analytics_meetings_detailed(
         base_query = base_query.order_by(sort_column.desc().nulls_last())
     else:
         base_query = base_query.order_by(sort_column.asc().nulls_last())
+    if keyset:
+        # Tie-breaker so the cursor identifies a unique position
+        key_order = Meeting.unique_session_id.desc() if sort_order == "desc" else Meeting.unique_session_id.asc()
+        base_query = base_query.order_by(key_order)
     
     # Apply pagination only if not requesting all records
     if not all:
-        offset = (page - 1) * limit
-        base_query = base_query.offset(offset).limit(limit)
+        if cursor:
+            # Seek past the previous page instead of skipping rows with OFFSET
+            base_query = apply_keyset(
+                base_query, Meeting.created_at, Meeting.unique_session_id, cursor, sort_order == "desc"
+            ).limit(limit)
+        else:
+            offset = (page - 1) * limit
+            base_query = base_query.offset(offset).limit(limit)
+            if total is None:
+                # Exact total in the same round-trip: the window runs before LIMIT
+                base_query = base_query.add_columns(func.count().over().label('total_count'))
     
     # Execute query with error handling
     try:
@@ -934,34 +1111,43 @@ async def analytics_meetings_detailed(
                 detail="Database query failed. Please try again later."
             )
     
+    next_cursor = None
+    if keyset and len(meetings) == limit:
+        next_cursor = encode_cursor(meetings[-1].created_at, meetings[-1].unique_session_id)
+    
     # Calculate pagination metadata
     if all:
         # When returning all records, pagination info reflects the complete dataset
+        total = len(meetings)
         total_pages = 1
         has_next = False
         has_prev = False
         page = 1
         limit = total
     else:
+        if total is None:
+            total = None if cursor else page_total(meetings, page)
+            if total is None:
+                total = await count_rows(db, count_query)
         total_pages = (total + limit - 1) // limit
-        has_next = page < total_pages
-        has_prev = page > 1
+        has_next, has_prev = page_flags(page, total_pages, cursor, next_cursor)
     
-    # Format response with all data
+    # Format response with all data; rows are already typed and rounded by
+    # the query, so they go out as plain dicts without model validation
     data = [
-        AdminDetailedMeeting(
-            meeting_id=meeting.meeting_id,
-            unique_session_id=meeting.unique_session_id,
-            title=meeting.title,
-            created_at=meeting.created_at,
-            duration_minutes=round(float(meeting.duration_minutes or 0), 2),
-            participant_count=meeting.participant_count,
-            speech_segments_count=meeting.speech_segments_count,
-            chat_messages_count=meeting.chat_messages_count,
-            host_user_id=meeting.user_id,
-            host_user_name=meeting.host_user_name,
-            host_user_email=meeting.host_user_email
-        )
+        {
+            "meeting_id": meeting.meeting_id,
+            "unique_session_id": meeting.unique_session_id,
+            "title": meeting.title,
+            "created_at": meeting.created_at,
+            "duration_minutes": meeting.duration_minutes,
+            "participant_count": meeting.participant_count,
+            "speech_segments_count": meeting.speech_segments_count,
+            "chat_messages_count": meeting.chat_messages_count,
+            "host_user_id": meeting.user_id,
+            "host_user_name": meeting.host_user_name,
+            "host_user_email": meeting.host_user_email
+        }
         for meeting in meetings
     ]
     
@@ -971,7 +1157,9 @@ async def analytics_meetings_detailed(
         total=total,
         total_pages=total_pages,
         has_next=has_next,
-        has_prev=has_prev
+        has_prev=has_prev,
+        total_is_estimate=total_is_estimate,
+        next_cursor=next_cursor
     )
     
     filters = {
@@ -980,7 +1168,14 @@ async def analytics_meetings_detailed(
         "search": search
     }
     
-    return AdminDetailedMeetingsResponse(data=data, pagination=pagination, filters=filters)
+    # Returned as ORJSONResponse directly so large (all=true) pages skip
+    # response-model validation and datetimes are encoded by orjson
+    return ORJSONResponse({
+        "success": True,
+        "data": data,
+        "pagination": pagination.model_dump(),
+        "filters": filters
+    })
 
 
 @router.get("/analytics/dashboard/metrics", response_model=AdminDashboardMetricsResponse)
@@ -995,54 +1190,64 @@ async def analytics_dashboard_metrics(
     # Validate parameters
     start_dt, end_dt = validate_date_params(start_date, end_date)
     
+    # Identical date ranges within the cache TTL share one response
+    cache_slot = current_analytics_metrics_slot(start_date, end_date)
+    if "response" not in cache_slot:
+        async with _analytics_metrics_lock:
+            # Another request may have filled the slot while we waited
+            if "response" not in cache_slot:
+                cache_slot["response"] = await compute_analytics_dashboard_metrics(
+                    db, start_date, end_date, start_dt, end_dt
+                )
+    return cache_slot["response"]
+
+
+async def compute_analytics_dashboard_metrics(
+    db: AsyncSession,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    start_dt: Optional[datetime],
+    end_dt: Optional[datetime]
+) -> AdminDashboardMetricsResponse:
+    """Count users, meetings, segments and chat messages in the date range"""
+    
     # Build queries with optional date filtering
     
     # Users count (filtered by registration date if dates provided)
     users_query = select(func.count(User.id))
-    if start_dt:
-        users_query = users_query.where(User.created_at >= start_dt)
-    if end_dt:
-        users_query = users_query.where(User.created_at <= end_dt)
+    users_query = apply_date_filter(users_query, User.created_at, start_dt, end_dt)
     
     # Meetings count (filtered by creation date if dates provided)
-    meetings_query = select(func.count(func.distinct(Meeting.unique_session_id)))
-    if start_dt:
-        meetings_query = meetings_query.where(Meeting.created_at >= start_dt)
-    if end_dt:
-        meetings_query = meetings_query.where(Meeting.created_at <= end_dt)
+    # unique_session_id is the primary key, so a plain count is already distinct
+    meetings_query = select(func.count(Meeting.unique_session_id))
+    meetings_query = apply_date_filter(meetings_query, Meeting.created_at, start_dt, end_dt)
     
     # Speech segments count (filtered by meeting creation date)
     segments_query = select(func.count(TranscriptSegment.id)).select_from(
         TranscriptSegment.join(Meeting, TranscriptSegment.session_id == Meeting.unique_session_id)
     )
-    if start_dt:
-        segments_query = segments_query.where(Meeting.created_at >= start_dt)
-    if end_dt:
-        segments_query = segments_query.where(Meeting.created_at <= end_dt)
+    segments_query = apply_date_filter(segments_query, Meeting.created_at, start_dt, end_dt)
     
     # Chat messages count (filtered by meeting creation date)
     messages_query = select(func.count(ChatMessage.id)).select_from(
         ChatMessage.join(Meeting, ChatMessage.session_id == Meeting.unique_session_id)
     )
-    if start_dt:
-        messages_query = messages_query.where(Meeting.created_at >= start_dt)
-    if end_dt:
-        messages_query = messages_query.where(Meeting.created_at <= end_dt)
-    
-    # Execute all queries in parallel
-    users_count, meetings_count, segments_count, messages_count = await asyncio.gather(
-        db.scalar(users_query),
-        db.scalar(meetings_query),
-        db.scalar(segments_query),
-        db.scalar(messages_query)
-    )
+    messages_query = apply_date_filter(messages_query, Meeting.created_at, start_dt, end_dt)
+    
+    # Execute all counts as scalar subqueries of one statement (one round-trip)
+    counts = (await db.execute(select(
+        users_query.scalar_subquery().label('users'),
+        meetings_query.scalar_subquery().label('meetings'),
+        segments_query.scalar_subquery().label('segments'),
+        messages_query.scalar_subquery().label('chat_messages')
+    ))).one()
     
     # Format response
     data = AdminDashboardMetricsData(
-        users=users_count or 0,
-        meetings=meetings_count or 0,
-        segments=segments_count or 0,
-        chat_messages=messages_count or 0
+        users=counts.users or 0,
+        meetings=counts.meetings or 0,
+        segments=counts.segments or 0,
+        chat_messages=counts.chat_messages or 0
     )
     
     metadata = {
@@ -1055,13 +1260,15 @@ async def analytics_dashboard_metrics(
     return AdminDashboardMetricsResponse(data=data, metadata=metadata)
 
 
-@router.get("/analytics/users/detailed", response_model=AdminDetailedUsersResponse)
+@router.get("/analytics/users/detailed", response_model=AdminDetailedUsersResponse, response_class=ORJSONResponse)
 async def analytics_users_detailed(
     start_date: Optional[str] = Query(None, description="Filter users by registration date"),
     end_date: Optional[str] = Query(None, description="Filter users by registration date"),
     search: Optional[str] = Query(None, description="Search by name or email"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    exact_total: bool = Query(False, description="Count the total exactly instead of estimating it"),
+    cursor: Optional[str] = Query(None, description="pagination.next_cursor of the previous page"),
     _: Dict[str, Any] = Depends(get_current_admin),
     db: AsyncSession = Depends(get_async_db)
 ):
@@ -1070,27 +1277,17 @@ async def analytics_users_detailed(
     # Validate parameters
     start_dt, end_dt = validate_date_params(start_date, end_date)
     
-    # Subquery for meeting counts and total duration
+    # Subquery for meeting counts, message counts and total duration per host,
+    # read from the per-meeting stats rather than re-aggregating segments
     meeting_stats_subquery = select(
         Meeting.user_id,
         func.count(Meeting.unique_session_id).label('meeting_count'),
-        func.sum(
-            func.coalesce(
-                (func.extract('epoch', func.max(TranscriptSegment.timestamp)) - 
-                 func.extract('epoch', func.min(TranscriptSegment.timestamp))) / 60.0,
-                0
-            )
+        func.coalesce(func.sum(MeetingStats.message_count), 0).label('message_count'),
+        func.coalesce(
+            func.sum(func.extract('epoch', MeetingStats.last_ts - MeetingStats.first_ts) / 60.0), 0
         ).label('total_duration')
     ).select_from(
-        Meeting.join(TranscriptSegment, Meeting.unique_session_id == TranscriptSegment.session_id, isouter=True)
-    ).group_by(Meeting.user_id).subquery()
-    
-    # Subquery for message counts
-    message_stats_subquery = select(
-        Meeting.user_id,
-        func.count(ChatMessage.id).label('message_count')
-    ).select_from(
-        Meeting.join(ChatMessage, Meeting.unique_session_id == ChatMessage.session_id, isouter=True)
+        Meeting.join(MeetingStats, Meeting.unique_session_id == MeetingStats.session_id, isouter=True)
     ).group_by(Meeting.user_id).subquery()
     
     # Main query
@@ -1100,52 +1297,70 @@ async def analytics_users_detailed(
         User.email,
         User.created_at,
         func.coalesce(meeting_stats_subquery.c.meeting_count, 0).label('meeting_count'),
-        func.coalesce(message_stats_subquery.c.message_count, 0).label('message_count'),
-        func.coalesce(meeting_stats_subquery.c.total_duration, 0).label('total_meeting_duration')
+        cast(func.coalesce(meeting_stats_subquery.c.message_count, 0), Integer).label('message_count'),
+        rounded_minutes(meeting_stats_subquery.c.total_duration).label('total_meeting_duration')
     ).select_from(
         User.join(meeting_stats_subquery, User.id == meeting_stats_subquery.c.user_id, isouter=True)
-        .join(message_stats_subquery, User.id == message_stats_subquery.c.user_id, isouter=True)
     )
     
     # Apply filters
-    if start_dt:
-        base_query = base_query.where(User.created_at >= start_dt)
-    if end_dt:
-        base_query = base_query.where(User.created_at <= end_dt)
+    base_query = apply_date_filter(base_query, User.created_at, start_dt, end_dt)
     if search:
         base_query = base_query.where(
             (User.name.ilike(f"%{search}%")) | 
             (User.email.ilike(f"%{search}%"))
         )
     
-    # Get total count for pagination
-    total = await db.scalar(select(func.count()).select_from(base_query.subquery()))
+    # Get total count for pagination; the stats join is one row per user, so
+    # counting the filtered users alone gives the same total
+    count_query = select(User.id)
+    count_query = apply_date_filter(count_query, User.created_at, start_dt, end_dt)
+    if search:
+        count_query = count_query.where(
+            (User.name.ilike(f"%{search}%")) | 
+            (User.email.ilike(f"%{search}%"))
+        )
+    total = None if exact_total else await estimate_total(db, count_query, min_exact=2 * page * limit)
+    total_is_estimate = total is not None
     
     # Apply pagination and ordering
-    offset = (page - 1) * limit
-    base_query = base_query.order_by(User.created_at.desc()).offset(offset).limit(limit)
+    base_query = base_query.order_by(User.created_at.desc(), User.id.desc())
+    if cursor:
+        # Seek past the previous page instead of skipping rows with OFFSET
+        base_query = apply_keyset(base_query, User.created_at, User.id, cursor).limit(limit)
+    else:
+        offset = (page - 1) * limit
+        base_query = base_query.offset(offset).limit(limit)
+        if total is None:
+            # Exact total in the same round-trip: the window runs before LIMIT
+            base_query = base_query.add_columns(func.count().over().label('total_count'))
     
     # Execute query
     result = await db.execute(base_query)
     users = result.all()
     
+    if total is None:
+        total = None if cursor else page_total(users, page)
+        if total is None:
+            total = await count_rows(db, count_query)
+    
     # Calculate pagination metadata
+    next_cursor = encode_cursor(users[-1].created_at, users[-1].id) if len(users) == limit else None
     total_pages = (total + limit - 1) // limit
-    has_next = page < total_pages
-    has_prev = page > 1
+    has_next, has_prev = page_flags(page, total_pages, cursor, next_cursor)
     
-    # Format response
+    # Format response; values are typed and rounded by the query
     data = [
-        AdminDetailedUser(
-            id=user.id,
-            name=user.name,
-            email=user.email,
-            created_at=user.created_at,
-            meeting_count=user.meeting_count,
-            message_count=user.message_count,
-            total_meeting_duration=round(float(user.total_meeting_duration or 0), 2),
-            status="active"
-        )
+        {
+            "id": user.id,
+            "name": user.name,
+            "email": user.email,
+            "created_at": user.created_at,
+            "meeting_count": user.meeting_count,
+            "message_count": user.message_count,
+            "total_meeting_duration": user.total_meeting_duration,
+            "status": "active"
+        }
         for user in users
     ]
     
@@ -1155,24 +1370,28 @@ async def analytics_users_detailed(
         total=total,
         total_pages=total_pages,
         has_next=has_next,
-        has_prev=has_prev
+        has_prev=has_prev,
+        total_is_estimate=total_is_estimate,
+        next_cursor=next_cursor
     )
     
-    return AdminDetailedUsersResponse(data=data, pagination=pagination)
+    return ORJSONResponse({
+        "success": True,
+        "data": data,
+        "pagination": pagination.model_dump()
+    })
 
 
 # =====================
 # User Management
 # =====================
 
-async def get_users_count(db: AsyncSession = Depends(get_async_db)):
-    return await db.scalar(select(func.count(User.id)))
-
 @router.get("/users")
 async def list_users(
     search: Optional[str] = None,
-    limit: int = Depends(get_users_count),
+    limit: int = Query(50, ge=1, le=500, description="Number of users per page"),
     page: int = 1,
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page; replaces page"),
     _: Dict[str, Any] = Depends(get_current_admin),
     db: AsyncSession = Depends(get_async_db),
 ):
@@ -1181,27 +1400,8 @@ async def list_users(
         page = 1
     
     
-    # Create subquery for meeting counts
-    meeting_count_subquery = (
-        select(
-            Meeting.user_id,
-            func.count(Meeting.unique_session_id).label('meeting_count')
-        )
-        .group_by(Meeting.user_id)
-        .subquery()
-    )
-    
-    # Create subquery for message counts
-    message_count_subquery = (
-        select(
-            Meeting.user_id,
-            func.count(ChatMessage.id).label('message_count')
-        )
-        .select_from(Meeting)
-        .join(ChatMessage, Meeting.unique_session_id == ChatMessage.session_id, isouter=True)
-        .group_by(Meeting.user_id)
-        .subquery()
-    )
+    # Meeting and message counts per user in one aggregation
+    counts_subquery = user_counts_subquery()
     
     # Build main query with meeting and message counts
     base_stmt = (
@@ -1210,29 +1410,37 @@ async def list_users(
             User.email,
             User.name,
             User.created_at,
-            func.coalesce(meeting_count_subquery.c.meeting_count, 0).label('total_meetings'),
-            func.coalesce(message_count_subquery.c.message_count, 0).label('total_messages')
+            func.coalesce(counts_subquery.c.meeting_count, 0).label('total_meetings'),
+            func.coalesce(counts_subquery.c.message_count, 0).label('total_messages')
         )
         .select_from(User)
-        .join(meeting_count_subquery, User.id == meeting_count_subquery.c.user_id, isouter=True)
-        .join(message_count_subquery, User.id == message_count_subquery.c.user_id, isouter=True)
+        .join(counts_subquery, User.id == counts_subquery.c.user_id, isouter=True)
     )
     
+    # The counts join is one row per user, so the total only needs users
+    count_stmt = select(func.count(User.id))
+    
     if search:
         # Search in both email and name fields
-        base_stmt = base_stmt.where(
-            (User.email.ilike(f"%{search}%")) | 
-            (User.name.ilike(f"%{search}%"))
-        )
-    
-    total = await db.scalar(select(func.count()).select_from(base_stmt.subquery()))
-    
-    # Calculate offset based on page number
-    offset = (page - 1) * limit
+        search_filter = (User.email.ilike(f"%{search}%")) | (User.name.ilike(f"%{search}%"))
+        base_stmt = base_stmt.where(search_filter)
+        count_stmt = count_stmt.where(search_filter)
+    
+    # Without a search the catalog estimate stands in for a full scan of users
+    total = None if search else await table_estimate(db, User.__tablename__, min_exact=2 * page * limit)
+    total_is_estimate = total is not None
+    if total is None:
+        total = await cached_count(db, users_count_key(search), count_stmt)
+    
+    base_stmt = base_stmt.order_by(User.created_at.desc(), User.id.desc())
+    if cursor:
+        # Seek past the previous page instead of skipping rows with OFFSET
+        base_stmt = apply_keyset(base_stmt, User.created_at, User.id, cursor)
+    else:
+        # Calculate offset based on page number
+        base_stmt = base_stmt.offset((page - 1) * limit)
     
-    users_result = await db.execute(
-        base_stmt.order_by(User.created_at.desc()).offset(offset).limit(limit)
-    )
+    users_result = await db.execute(base_stmt.limit(limit))
     users = users_result.all()
     
     items = [
@@ -1248,9 +1456,9 @@ async def list_users(
     ]
     
     # Calculate pagination metadata
+    next_cursor = encode_cursor(users[-1].created_at, users[-1].id) if len(users) == limit else None
     total_pages = (total + limit - 1) // limit  # Ceiling division
-    has_next = page < total_pages
-    has_prev = page > 1
+    has_next, has_prev = page_flags(page, total_pages, cursor, next_cursor)
     
     return {
         "total": total,
@@ -1259,30 +1467,18 @@ async def list_users(
         "limit": limit,
         "total_pages": total_pages,
         "has_next": has_next,
-        "has_prev": has_prev
+        "has_prev": has_prev,
+        "total_is_estimate": total_is_estimate,
+        "next_cursor": next_cursor
     }
 
 
 @router.get("/users/{user_id}")
 async def get_user(user_id: str, _: Dict[str, Any] = Depends(get_current_admin), db: AsyncSession = Depends(get_async_db)):
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    if not user:
+    row = (await db.execute(user_with_counts_stmt(user_id))).first()
+    if not row:
         raise HTTPException(status_code=404, detail="User not found")
-    
-    # Get meeting count for this user
-    meeting_count = await db.scalar(
-        select(func.count(Meeting.unique_session_id))
-        .where(Meeting.user_id == user_id)
-    )
-    
-    # Get message count for this user
-    message_count = await db.scalar(
-        select(func.count(ChatMessage.id))
-        .select_from(Meeting)
-        .join(ChatMessage, Meeting.unique_session_id == ChatMessage.session_id, isouter=True)
-        .where(Meeting.user_id == user_id)
-    )
+    user, meeting_count, message_count = row
     
     return {
         "id": user.id,
@@ -1317,6 +1513,8 @@ async def update_user(
     db.add(user)
     await db.commit()
     await db.refresh(user)
+    # Name/email changes can move the user in or out of cached search counts
+    _count_for_bucket.cache_clear()
     return {
         "id": user.id,
         "email": user.email,
@@ -1355,7 +1553,9 @@ def user_ai_usage(user_id: str, _: Dict[str, Any] = Depends(get_current_admin)):
 
 @router.get("/users/stats")
 async def users_stats(_: Dict[str, Any] = Depends(get_current_admin), db: AsyncSession = Depends(get_async_db)):
-    total_users = await db.scalar(select(func.count(User.id)))
+    total_users = await table_estimate(db, User.__tablename__) or await cached_count(
+        db, users_count_key(None), select(func.count(User.id))
+    )
     return {"total_users": total_users}
 
 
@@ -1364,31 +1564,13 @@ async def all_users_meetings_stats(
     search: Optional[str] = Query(None, description="Search by user email or name"),
     limit: int = Query(100, ge=1, le=500, description="Number of users to return"),
     page: int = Query(1, ge=1, description="Page number"),
+    cursor: Optional[str] = Query(None, description="pagination.next_cursor of the previous page; replaces page"),
     _: Dict[str, Any] = Depends(get_current_admin),
     db: AsyncSession = Depends(get_async_db)
 ):
     """Get meeting statistics for all users"""
-    # Build base query with meeting count using subquery
-    meeting_subquery = (
-        select(
-            Meeting.user_id,
-            func.count(Meeting.unique_session_id).label('meeting_count')
-        )
-        .group_by(Meeting.user_id)
-        .subquery()
-    )
-    
-    # Build subquery for message counts
-    message_subquery = (
-        select(
-            Meeting.user_id,
-            func.count(ChatMessage.id).label('message_count')
-        )
-        .select_from(Meeting)
-        .join(ChatMessage, Meeting.unique_session_id == ChatMessage.session_id, isouter=True)
-        .group_by(Meeting.user_id)
-        .subquery()
-    )
+    # Meeting and message counts per user in one aggregation
+    counts_subquery = user_counts_subquery()
     
     # Join users with their meeting and message counts
     base_stmt = (
@@ -1397,35 +1579,42 @@ async def all_users_meetings_stats(
             User.email,
             User.name,
             User.created_at,
-            func.coalesce(meeting_subquery.c.meeting_count, 0).label('total_meetings'),
-            func.coalesce(message_subquery.c.message_count, 0).label('total_messages')
+            func.coalesce(counts_subquery.c.meeting_count, 0).label('total_meetings'),
+            func.coalesce(counts_subquery.c.message_count, 0).label('total_messages')
         )
         .select_from(User)
-        .join(meeting_subquery, User.id == meeting_subquery.c.user_id, isouter=True)
-        .join(message_subquery, User.id == message_subquery.c.user_id, isouter=True)
+        .join(counts_subquery, User.id == counts_subquery.c.user_id, isouter=True)
     )
     
+    # The counts join is one row per user, so the total only needs users
+    count_stmt = select(func.count(User.id))
+    
     # Apply search filter
     if search:
-        base_stmt = base_stmt.where(
-            (User.email.ilike(f"%{search}%")) | 
-            (User.name.ilike(f"%{search}%"))
-        )
+        search_filter = (User.email.ilike(f"%{search}%")) | (User.name.ilike(f"%{search}%"))
+        base_stmt = base_stmt.where(search_filter)
+        count_stmt = count_stmt.where(search_filter)
     
-    # Get total count for pagination
-    total = await db.scalar(select(func.count()).select_from(base_stmt.subquery()))
+    # Get total count for pagination; without a search the catalog estimate avoids a full scan
+    total = None if search else await table_estimate(db, User.__tablename__, min_exact=2 * page * limit)
+    total_is_estimate = total is not None
+    if total is None:
+        total = await cached_count(db, users_count_key(search), count_stmt)
     
     # Apply pagination and ordering
-    offset = (page - 1) * limit
-    exec_result = await db.execute(
-        base_stmt.order_by(User.created_at.desc()).offset(offset).limit(limit)
-    )
+    base_stmt = base_stmt.order_by(User.created_at.desc(), User.id.desc())
+    if cursor:
+        # Seek past the previous page instead of skipping rows with OFFSET
+        base_stmt = apply_keyset(base_stmt, User.created_at, User.id, cursor)
+    else:
+        base_stmt = base_stmt.offset((page - 1) * limit)
+    exec_result = await db.execute(base_stmt.limit(limit))
     results = exec_result.all()
     
     # Calculate pagination metadata
+    next_cursor = encode_cursor(results[-1].created_at, results[-1].id) if len(results) == limit else None
     total_pages = (total + limit - 1) // limit
-    has_next = page < total_pages
-    has_prev = page > 1
+    has_next, has_prev = page_flags(page, total_pages, cursor, next_cursor)
     
     return {
         "filters": {
@@ -1437,7 +1626,9 @@ async def all_users_meetings_stats(
             "limit": limit,
             "total_pages": total_pages,
             "has_next": has_next,
-            "has_prev": has_prev
+            "has_prev": has_prev,
+            "total_is_estimate": total_is_estimate,
+            "next_cursor": next_cursor
         },
         "users": [
             {
@@ -1460,20 +1651,10 @@ async def user_meetings_stats(
     db: AsyncSession = Depends(get_async_db)
 ):
     """Get total meetings count for a specific user"""
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    if not user:
+    row = (await db.execute(user_with_counts_stmt(user_id))).first()
+    if not row:
         raise HTTPException(status_code=404, detail="User not found")
-    
-    total_meetings = await db.scalar(select(func.count(Meeting.unique_session_id)).where(Meeting.user_id == user_id))
-    
-    # Get message count for this user
-    total_messages = await db.scalar(
-        select(func.count(ChatMessage.id))
-        .select_from(Meeting)
-        .join(ChatMessage, Meeting.unique_session_id == ChatMessage.session_id, isouter=True)
-        .where(Meeting.user_id == user_id)
-    )
+    user, total_meetings, total_messages = row
     
     return {
         "user_id": user_id,
@@ -1484,7 +1665,7 @@ async def user_meetings_stats(
     }
 
 
-@router.get("/users/{user_id}/meetings")
+@router.get("/users/{user_id}/meetings", response_class=ORJSONResponse)
 async def user_meetings_filtered(
     user_id: str,
     start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
@@ -1530,7 +1711,7 @@ async def user_meetings_filtered(
     # Add duration to meetings
     meetings_with_duration = await get_meetings_with_duration_batch(db, meetings)
     
-    return {
+    return ORJSONResponse({
         "user_id": user_id,
         "user_email": user.email,
         "user_name": user.name,
@@ -1547,10 +1728,10 @@ async def user_meetings_filtered(
             "has_prev": has_prev
         },
         "meetings": meetings_with_duration
-    }
+    })
 
 
-@router.get("/meetings/filtered")
+@router.get("/meetings/filtered", response_class=ORJSONResponse)
 async def all_meetings_filtered(
     start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
@@ -1558,47 +1739,53 @@ async def all_meetings_filtered(
     page: int = Query(1, ge=1, description="Page number"),
     user_search: Optional[str] = Query(None, description="Search by user email or name"),
     all: bool = Query(False, description="Return all meetings without pagination"),
+    cursor: Optional[str] = Query(None, description="pagination.next_cursor of the previous page; replaces page"),
     _: Dict[str, Any] = Depends(get_current_admin),
     db: AsyncSession = Depends(get_async_db)
 ):
     """Filter all users' meetings by date or date interval with optional user search"""
     # Build query with JOIN to User table for search capability
     base_stmt = select(Meeting, User).join(User, Meeting.user_id == User.id)
+    # Every meeting has exactly one host, so the total counts meetings and
+    # joins users only when searching by them
+    count_stmt = select(func.count(Meeting.unique_session_id))
     
     # Apply date filters
-    if start_date:
-        start_datetime = datetime.combine(start_date, datetime.min.time())
-        base_stmt = base_stmt.where(Meeting.created_at >= start_datetime)
-    
-    if end_date:
-        end_datetime = datetime.combine(end_date, datetime.max.time())
-        base_stmt = base_stmt.where(Meeting.created_at <= end_datetime)
+    start_datetime = datetime.combine(start_date, datetime.min.time()) if start_date else None
+    end_datetime = datetime.combine(end_date, datetime.max.time()) if end_date else None
+    base_stmt = apply_date_filter(base_stmt, Meeting.created_at, start_datetime, end_datetime)
+    count_stmt = apply_date_filter(count_stmt, Meeting.created_at, start_datetime, end_datetime)
     
     # Apply user search filter
     if user_search:
-        base_stmt = base_stmt.where(
-            (User.email.ilike(f"%{user_search}%")) | 
-            (User.name.ilike(f"%{user_search}%"))
-        )
+        search_filter = (User.email.ilike(f"%{user_search}%")) | (User.name.ilike(f"%{user_search}%"))
+        base_stmt = base_stmt.where(search_filter)
+        count_stmt = count_stmt.join(User, Meeting.user_id == User.id).where(search_filter)
     
-    # Get total count for pagination
-    total = await db.scalar(select(func.count()).select_from(base_stmt.subquery()))
+    # Get total count for pagination (the full result carries its own count)
+    total = None if all else await db.scalar(count_stmt)
     
     # Apply pagination and order
+    base_stmt = base_stmt.order_by(Meeting.created_at.desc(), Meeting.unique_session_id.desc())
     if not all:
-        offset = (page - 1) * limit
-        exec_result = await db.execute(
-            base_stmt.order_by(Meeting.created_at.desc()).offset(offset).limit(limit)
-        )
-    else:
-        exec_result = await db.execute(
-            base_stmt.order_by(Meeting.created_at.desc())
-        )
+        if cursor:
+            # Seek past the previous page instead of skipping rows with OFFSET
+            base_stmt = apply_keyset(base_stmt, Meeting.created_at, Meeting.unique_session_id, cursor)
+        else:
+            base_stmt = base_stmt.offset((page - 1) * limit)
+        base_stmt = base_stmt.limit(limit)
+    exec_result = await db.execute(base_stmt)
     meeting_user_pairs = exec_result.all()
     
+    next_cursor = None
+    if not all and len(meeting_user_pairs) == limit:
+        last_meeting = meeting_user_pairs[-1][0]
+        next_cursor = encode_cursor(last_meeting.created_at, last_meeting.unique_session_id)
+    
     # Calculate pagination metadata
     if all:
         # When returning all records, pagination info reflects the complete dataset
+        total = len(meeting_user_pairs)
         total_pages = 1
         has_next = False
         has_prev = False
@@ -1606,13 +1793,12 @@ async def all_meetings_filtered(
         limit = total
     else:
         total_pages = (total + limit - 1) // limit
-        has_next = page < total_pages
-        has_prev = page > 1
+        has_next, has_prev = page_flags(page, total_pages, cursor, next_cursor)
     
     # Add duration to meetings
-    meetings_with_duration = await get_meetings_with_duration_batch(db, meeting_user_pairs)
+    meetings_with_duration = await get_meetings_with_duration_batch_from_rows(db, meeting_user_pairs)
     
-    return {
+    return ORJSONResponse({
         "filters": {
             "start_date": start_date.isoformat() if start_date else None,
             "end_date": end_date.isoformat() if end_date else None,
@@ -1624,10 +1810,11 @@ async def all_meetings_filtered(
             "limit": limit,
             "total_pages": total_pages,
             "has_next": has_next,
-            "has_prev": has_prev
+            "has_prev": has_prev,
+            "next_cursor": next_cursor
         },
         "meetings": meetings_with_duration
-    }
+    })
 
 
 # =====================
@@ -1636,8 +1823,13 @@ async def all_meetings_filtered(
 
 @router.get("/meetings/stats")
 async def meetings_stats(_: Dict[str, Any] = Depends(get_current_admin), db: AsyncSession = Depends(get_async_db)):
-    total_meetings = await db.scalar(select(func.count(Meeting.unique_session_id)))
-    total_segments = await db.scalar(select(func.count(TranscriptSegment.id)))
+    # Large tables are reported from the catalog estimate rather than counted
+    total_meetings = await table_estimate(db, Meeting.__tablename__) or await cached_count(
+        db, "meetings", select(func.count(Meeting.unique_session_id))
+    )
+    total_segments = await table_estimate(db, TranscriptSegment.__tablename__) or await cached_count(
+        db, "segments", select(func.count(TranscriptSegment.id))
+    )
     return {"total_meetings": total_meetings, "total_segments": total_segments}
 
 
@@ -1729,8 +1921,9 @@ async def database_pool_status(_: Dict[str, Any] = Depends(get_current_admin)):
 @router.post("/system/clear-metrics-cache")
 async def clear_metrics_cache(_: Dict[str, Any] = Depends(get_current_admin)):
     """Clear the dashboard metrics cache to force fresh data"""
-    global _metrics_cache
-    _metrics_cache = {"data": None, "timestamp": 0, "ttl": 60}
+    _metrics_for_bucket.cache_clear()
+    _analytics_metrics_for_bucket.cache_clear()
+    _count_for_bucket.cache_clear()
     return {"message": "Metrics cache cleared successfully"}
 
 
@@ -27,7 +27,8 @@ def setup_paths():
 setup_paths()
 
 # Теперь можно импортировать модули
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -84,6 +85,8 @@ load_dotenv()
 
 # Импортируем роутер после настройки всех путей
 from dapmeet.api import api_router as main_router
+from dapmeet.db.db import async_engine
+from dapmeet.services.analytics_views import REFRESH_INTERVAL_SECONDS, run_refresh_loop
 
 
 @asynccontextmanager
@@ -93,9 +96,21 @@ async def lifespan(app: FastAPI):
         timeout=httpx.Timeout(10.0),
         limits=httpx.Limits(max_keepalive_connections=50, max_connections=100)
     )
+    # Periodically refresh the analytics materialized views (PostgreSQL only)
+    refresh_task = None
+    if (
+        async_engine is not None
+        and async_engine.dialect.name == "postgresql"
+        and REFRESH_INTERVAL_SECONDS > 0
+    ):
+        refresh_task = asyncio.create_task(run_refresh_loop(async_engine))
     try:
         yield
     finally:
+        if refresh_task is not None:
+            refresh_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await refresh_task
         # Shutdown: close HTTP client
         await app.state.http_client.aclose()
 
@@ -59,9 +59,13 @@ if DATABASE_URL_ASYNC:
     # To customize, set environment variables:
     #   - DB_POOL_SIZE: base pool size per instance (default 8)
     #   - DB_POOL_MAX_OVERFLOW: max overflow per instance (default 22)
+    #   - DB_PREPARED_STATEMENT_CACHE_SIZE: asyncpg prepared statements kept per
+    #     connection (default 500, 0 disables — needed behind pgbouncer in
+    #     transaction mode)
     
     pool_size = int(os.getenv("DB_POOL_SIZE", "8"))
     max_overflow = int(os.getenv("DB_POOL_MAX_OVERFLOW", "22"))
+    prepared_statement_cache_size = int(os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE", "500"))
     
     engine_kwargs = {
         "pool_pre_ping": True,
@@ -73,12 +77,24 @@ if DATABASE_URL_ASYNC:
         "echo_pool": False,  # Set to True for debugging connection pool issues
     }
     
+    connect_args = {}
+    
+    # The asyncpg driver prepares every statement server-side and reuses it
+    # from a per-connection LRU cache, so repeated queries skip parse/plan.
+    # The driver default (100) is small for the number of distinct admin and
+    # analytics queries, which would otherwise keep evicting each other.
+    if DATABASE_URL_ASYNC.startswith("postgresql+asyncpg"):
+        connect_args["prepared_statement_cache_size"] = prepared_statement_cache_size
+    
     # Add SSL for production databases (Render requires it)
     if "sslmode=require" in DATABASE_URL_ASYNC:
-        engine_kwargs["connect_args"] = {"sslmode": "require"}
+        connect_args["sslmode"] = "require"
     elif "render.com" in DATABASE_URL_ASYNC or ".internal" in DATABASE_URL_ASYNC:
         # Render databases require SSL even for internal connections
-        engine_kwargs["connect_args"] = {"sslmode": "require"}
+        connect_args["sslmode"] = "require"
+    
+    if connect_args:
+        engine_kwargs["connect_args"] = connect_args
     
     async_engine = create_async_engine(DATABASE_URL_ASYNC, **engine_kwargs)
     AsyncSessionLocal = async_sessionmaker(
@@ -4,9 +4,10 @@
 from .user import User
 from .meeting import Meeting  
 from .segment import TranscriptSegment
+from .meeting_stats import MeetingStats
 from .prompt import Prompt
 from .phone_verification import PhoneVerification
 from .subscription import Subscription, SubscriptionHistory, SubscriptionPlan, SubscriptionStatus
 
 # Делаем их доступными при импорте пакета
-__all__ = ["User", "Meeting", "TranscriptSegment", "Prompt", "PhoneVerification", "Subscription", "SubscriptionHistory", "SubscriptionPlan", "SubscriptionStatus"]
\ No newline at end of file
+__all__ = ["User", "Meeting", "TranscriptSegment", "MeetingStats", "Prompt", "PhoneVerification", "Subscription", "SubscriptionHistory", "SubscriptionPlan", "SubscriptionStatus"]
\ No newline at end of file
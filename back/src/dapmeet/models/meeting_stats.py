@@ -0,0 +1,105 @@
+from sqlalchemy import DDL, Column, Integer, String, DateTime, ForeignKey, event
+from dapmeet.db.db import Base
+
+# A row that leaves a meeting (DELETE, or an UPDATE of session_id) is taken
+# off OLD.session_id; a row that joins one (INSERT, or the same UPDATE) is
+# added to NEW.session_id. A session_id change that moves a segment to
+# another hash partition arrives as DELETE + INSERT instead of UPDATE.
+SEGMENT_TRIGGER_FUNCTION = """
+    CREATE OR REPLACE FUNCTION meeting_stats_on_segment() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND NEW.session_id IS DISTINCT FROM OLD.session_id) THEN
+            -- Plain UPDATE: a cascaded meeting delete must not re-create the row
+            UPDATE meeting_stats SET
+                segment_count = segment_count - 1,
+                first_ts = (SELECT min(timestamp) FROM transcript_segments WHERE session_id = OLD.session_id),
+                last_ts = (SELECT max(timestamp) FROM transcript_segments WHERE session_id = OLD.session_id)
+            WHERE session_id = OLD.session_id;
+        END IF;
+
+        IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.session_id IS DISTINCT FROM OLD.session_id) THEN
+            INSERT INTO meeting_stats (session_id, segment_count, first_ts, last_ts)
+            VALUES (NEW.session_id, 1, NEW.timestamp, NEW.timestamp)
+            ON CONFLICT (session_id) DO UPDATE SET
+                segment_count = meeting_stats.segment_count + 1,
+                first_ts = LEAST(meeting_stats.first_ts, EXCLUDED.first_ts),
+                last_ts = GREATEST(meeting_stats.last_ts, EXCLUDED.last_ts);
+        ELSIF TG_OP = 'UPDATE' THEN
+            -- Timestamp moved within the same meeting
+            UPDATE meeting_stats SET
+                first_ts = (SELECT min(timestamp) FROM transcript_segments WHERE session_id = NEW.session_id),
+                last_ts = (SELECT max(timestamp) FROM transcript_segments WHERE session_id = NEW.session_id)
+            WHERE session_id = NEW.session_id;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+"""
+
+SEGMENT_TRIGGER = """
+    CREATE TRIGGER trg_meeting_stats_segments
+    AFTER INSERT OR DELETE OR UPDATE OF timestamp, session_id ON transcript_segments
+    FOR EACH ROW EXECUTE FUNCTION meeting_stats_on_segment()
+"""
+
+MESSAGE_TRIGGER_FUNCTION = """
+    CREATE OR REPLACE FUNCTION meeting_stats_on_message() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND NEW.session_id IS DISTINCT FROM OLD.session_id) THEN
+            UPDATE meeting_stats SET
+                message_count = message_count - 1,
+                last_message_ts = (SELECT max(created_at) FROM chat_messages WHERE session_id = OLD.session_id)
+            WHERE session_id = OLD.session_id;
+        END IF;
+
+        IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.session_id IS DISTINCT FROM OLD.session_id) THEN
+            INSERT INTO meeting_stats (session_id, message_count, last_message_ts)
+            VALUES (NEW.session_id, 1, NEW.created_at)
+            ON CONFLICT (session_id) DO UPDATE SET
+                message_count = meeting_stats.message_count + 1,
+                last_message_ts = GREATEST(meeting_stats.last_message_ts, EXCLUDED.last_message_ts);
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+"""
+
+MESSAGE_TRIGGER = """
+    CREATE TRIGGER trg_meeting_stats_messages
+    AFTER INSERT OR DELETE OR UPDATE OF session_id ON chat_messages
+    FOR EACH ROW EXECUTE FUNCTION meeting_stats_on_message()
+"""
+
+
+class MeetingStats(Base):
+    """Per-meeting segment/message aggregates, maintained by database triggers"""
+    __tablename__ = "meeting_stats"
+
+    session_id      = Column(String, ForeignKey("meetings.unique_session_id", ondelete="CASCADE"), primary_key=True)
+    segment_count   = Column(Integer, nullable=False, default=0)
+    first_ts        = Column(DateTime(timezone=True), nullable=True)
+    last_ts         = Column(DateTime(timezone=True), nullable=True)
+    message_count   = Column(Integer, nullable=False, default=0)
+    last_message_ts = Column(DateTime(timezone=True), nullable=True)
+
+
+def _creates_meeting_stats(ddl, target, bind, tables=None, **kw):
+    return tables is None or MeetingStats.__table__ in tables
+
+# Schemas built with create_all (init_db, tests) need the triggers as well,
+# or meeting_stats stays empty. They are installed once all tables exist,
+# since each trigger sits on transcript_segments / chat_messages.
+for _statement in (SEGMENT_TRIGGER_FUNCTION, SEGMENT_TRIGGER, MESSAGE_TRIGGER_FUNCTION, MESSAGE_TRIGGER):
+    event.listen(
+        Base.metadata,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql", callable_=_creates_meeting_stats),
+    )
+
+# drop_all drops the triggers with their tables; the functions are left over
+for _function in ("meeting_stats_on_segment", "meeting_stats_on_message"):
+    event.listen(
+        Base.metadata,
+        "after_drop",
+        DDL(f"DROP FUNCTION IF EXISTS {_function}()").execute_if(dialect="postgresql", callable_=_creates_meeting_stats),
+    )
@@ -65,7 +65,7 @@ class SubscriptionStatusEnum(TypeDecorator):
 class Subscription(Base):
     __tablename__ = "subscriptions"
 
-    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True, index=True)
     plan = Column(SubscriptionPlanEnum(), nullable=False, default=SubscriptionPlan.FREE.value, index=True)
     status = Column(SubscriptionStatusEnum(), nullable=False, default=SubscriptionStatus.ACTIVE.value, index=True)
@@ -85,7 +85,7 @@ class Subscription(Base):
 class SubscriptionHistory(Base):
     __tablename__ = "subscription_history"
 
-    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
     subscription_id = Column(Integer, ForeignKey("subscriptions.id", ondelete="CASCADE"), nullable=False, index=True)
     old_plan = Column(SubscriptionPlanEnum(), nullable=True)
     new_plan = Column(SubscriptionPlanEnum(), nullable=False)
@@ -0,0 +1,79 @@
+"""
+Materialized views with daily rollups for the admin analytics endpoints
+"""
+import asyncio
+import logging
+import os
+
+from sqlalchemy import column, func, select, table, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# Seconds between refreshes; 0 disables the background refresh
+REFRESH_INTERVAL_SECONDS = int(os.getenv("ANALYTICS_VIEWS_REFRESH_SECONDS", "300"))
+
+# Any constant works; it only has to be the same for every API instance
+_REFRESH_LOCK_KEY = 0x6D76_7265
+
+mv_user_reg_daily = table(
+    "mv_user_reg_daily",
+    column("day"),
+    column("count"),
+)
+
+mv_meeting_counts_daily = table(
+    "mv_meeting_counts_daily",
+    column("day"),
+    column("count"),
+)
+
+mv_meeting_duration_daily = table(
+    "mv_meeting_duration_daily",
+    column("day"),
+    column("total_minutes"),
+    column("min_minutes"),
+    column("max_minutes"),
+    column("meeting_count"),
+)
+
+ANALYTICS_VIEWS = (mv_user_reg_daily, mv_meeting_counts_daily, mv_meeting_duration_daily)
+
+# Single row with the time of the last refresh. Kept out of the views so that
+# unchanged days stay unchanged and REFRESH ... CONCURRENTLY rewrites only
+# the rows whose counts moved.
+analytics_views_refresh = table(
+    "analytics_views_refresh",
+    column("refreshed_at"),
+)
+
+
+def last_refresh_subquery():
+    """Scalar subquery for the time the analytics views were last refreshed"""
+    return select(analytics_views_refresh.c.refreshed_at).scalar_subquery()
+
+
+async def refresh_analytics_views(engine: AsyncEngine) -> bool:
+    """
+    Refresh every analytics view without blocking readers
+
+    Returns False when another instance is already refreshing.
+    """
+    async with engine.begin() as conn:
+        acquired = await conn.scalar(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": _REFRESH_LOCK_KEY})
+        if not acquired:
+            return False
+        for view in ANALYTICS_VIEWS:
+            await conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view.name}"))
+        await conn.execute(analytics_views_refresh.update().values(refreshed_at=func.now()))
+    return True
+
+
+async def run_refresh_loop(engine: AsyncEngine, interval: int = REFRESH_INTERVAL_SECONDS) -> None:
+    """Refresh the analytics views every interval seconds until cancelled"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await refresh_analytics_views(engine)
+        except Exception as e:
+            logger.warning(f"Failed to refresh analytics views: {e}")
@@ -1,12 +1,66 @@
 import os
+import asyncio
 import logging
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig
+from fastapi_mail.connection import Connection
+from fastapi_mail.fastmail import email_dispatched
+from fastapi_mail.msg import MailMsg
 from jinja2 import Template
 from pydantic import EmailStr
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=32)
+def _compile_template(source: str) -> Template:
+    """Compile a Jinja2 template once per distinct source string"""
+    return Template(source)
+
+
+class _PooledSMTPConnection:
+    """
+    One SMTP connection reused across messages
+    
+    FastMail.send_message opens a connection per message, so reuse needs
+    fastapi-mail internals (checked against fastapi-mail 1.4.1):
+    MailMsg._message, Connection._configure_connection and
+    Connection.session. All of them are used only in this class; re-check
+    it when upgrading fastapi-mail.
+    """
+    
+    def __init__(self, config: ConnectionConfig):
+        self.config = config
+        self._connection: Optional[Connection] = None
+    
+    async def send(self, message: MessageSchema) -> None:
+        """Send message, connecting on first use and after the server drops an idle connection"""
+        sender = self.config.MAIL_FROM
+        if self.config.MAIL_FROM_NAME is not None:
+            sender = f"{self.config.MAIL_FROM_NAME} <{self.config.MAIL_FROM}>"
+        msg = await MailMsg(message)._message(sender)
+        
+        if self._connection is None or not self._connection.session.is_connected:
+            connection = Connection(self.config)
+            await connection._configure_connection()
+            self._connection = connection
+        await self._connection.session.send_message(msg)
+        # FastMail.send_message emits this after every send
+        email_dispatched.send(msg)
+    
+    async def close(self) -> None:
+        """Quit the connection if one was opened"""
+        connection, self._connection = self._connection, None
+        if connection is None or not connection.session.is_connected:
+            return
+        try:
+            await connection.session.quit()
+        except Exception as e:
+            logger.warning(f"Failed to close SMTP connection: {str(e)}")
+
+
 class EmailService:
     def __init__(self):
         """Initialize email service with configuration from environment variables"""
@@ -23,6 +77,41 @@ class EmailService:
             VALIDATE_CERTS=os.getenv("VALIDATE_CERTS", "true").lower() == "true",
         )
         self.fastmail = FastMail(self.config)
+        # Open SMTP connections shared by sends made inside smtp_pool()
+        self._pool: Optional[asyncio.Queue] = None
+    
+    @asynccontextmanager
+    async def smtp_pool(self, size: int = 1):
+        """
+        Keep `size` SMTP connections open while the block runs
+        
+        Sends made inside the block reuse these connections instead of
+        connecting, negotiating TLS and logging in again for every message.
+        Connections are opened by the first send that needs them, so a
+        connection or login failure fails that message only.
+        
+        Args:
+            size: Number of connections (match the number of concurrent senders)
+        """
+        connections = [_PooledSMTPConnection(self.config) for _ in range(max(size, 1))]
+        pool = asyncio.Queue()
+        for connection in connections:
+            pool.put_nowait(connection)
+        self._pool = pool
+        try:
+            yield
+        finally:
+            self._pool = None
+            for connection in connections:
+                await connection.close()
+    
+    async def _send_pooled(self, message: MessageSchema) -> None:
+        """Send a message over one of the connections held by smtp_pool()"""
+        connection = await self._pool.get()
+        try:
+            await connection.send(message)
+        finally:
+            self._pool.put_nowait(connection)
     
     async def send_email(
         self, 
@@ -50,7 +139,7 @@ class EmailService:
         try:
             # If template is provided, render it with variables
             if template:
-                jinja_template = Template(template)
+                jinja_template = _compile_template(template)
                 rendered_content = jinja_template.render(template_vars or {})
                 html_content = rendered_content
             
@@ -62,8 +151,11 @@ class EmailService:
                 subtype="html" if html_content else "plain"
             )
             
-            # Send email
-            await self.fastmail.send_message(message)
+            # Send email, reusing a pooled SMTP connection when one is open
+            if self._pool is not None and not self.config.SUPPRESS_SEND:
+                await self._send_pooled(message)
+            else:
+                await self.fastmail.send_message(message)
             logger.info(f"Email sent successfully to {to_email}")
             return True
             
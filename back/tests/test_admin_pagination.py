@@ -0,0 +1,100 @@
+"""
+Tests for the admin API keyset pagination helpers.
+"""
+import base64
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from dapmeet.api.admin import apply_keyset, decode_cursor, encode_cursor, page_flags
+from dapmeet.models.user import User
+from tests.factories import UserFactory
+
+
+class TestCursorEncoding:
+    """Test encode_cursor / decode_cursor."""
+
+    def test_round_trip(self):
+        """Test a cursor decodes to the values it was made from."""
+        created_at = datetime(2025, 11, 25, 12, 30, 15, 123456)
+
+        cursor = encode_cursor(created_at, "user|with|pipes")
+
+        assert decode_cursor(cursor) == (created_at, "user|with|pipes")
+
+    @pytest.mark.parametrize("cursor", [
+        "not base64!",
+        "Zm9v",  # "foo": no separator
+        base64.urlsafe_b64encode(b"not-a-date|key").decode("ascii"),
+        "кириллица",
+    ])
+    def test_malformed_cursor_is_400(self, cursor):
+        """Test malformed cursors are rejected as a bad request."""
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(cursor)
+
+        assert exc_info.value.status_code == 400
+
+
+class TestPageFlags:
+    """Test has_next / has_prev for offset and cursor pages."""
+
+    def test_offset_pages(self):
+        """Test offset pages use page and total_pages."""
+        assert page_flags(1, 3, None, "next") == (True, False)
+        assert page_flags(3, 3, None, None) == (False, True)
+
+    def test_cursor_pages(self):
+        """Test cursor pages ignore page and follow next_cursor."""
+        assert page_flags(1, 1, "cursor", "next") == (True, True)
+        assert page_flags(1, 5, "cursor", None) == (False, True)
+
+
+class TestApplyKeyset:
+    """Test apply_keyset ordering against the database."""
+
+    @pytest_asyncio.fixture
+    async def users(self, async_db_session: AsyncSession):
+        """Create users, some sharing created_at to exercise the tie-breaker."""
+        base = datetime(2025, 1, 1, 12, 0, 0)
+        users = []
+        for i in range(7):
+            user = UserFactory.create(id=f"user_{i}")
+            user.created_at = base + timedelta(minutes=i // 2)
+            users.append(user)
+        async_db_session.add_all(users)
+        await async_db_session.commit()
+        return users
+
+    @staticmethod
+    async def _walk(db: AsyncSession, descending: bool, limit: int = 3):
+        """Collect user ids page by page, following cursors."""
+        if descending:
+            order = (User.created_at.desc(), User.id.desc())
+        else:
+            order = (User.created_at.asc(), User.id.asc())
+
+        seen, cursor = [], None
+        while True:
+            query = select(User.id, User.created_at).order_by(*order)
+            if cursor:
+                query = apply_keyset(query, User.created_at, User.id, cursor, descending=descending)
+            rows = (await db.execute(query.limit(limit))).all()
+            seen.extend(row.id for row in rows)
+            if len(rows) < limit:
+                return seen
+            cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("descending", [True, False])
+    async def test_pages_follow_full_ordering(self, async_db_session: AsyncSession, users, descending):
+        """Test cursor pages concatenate to the full ordering without gaps or repeats."""
+        expected = sorted(users, key=lambda u: (u.created_at, u.id), reverse=descending)
+
+        seen = await self._walk(async_db_session, descending)
+
+        assert seen == [u.id for u in expected]
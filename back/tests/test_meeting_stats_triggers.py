@@ -0,0 +1,170 @@
+"""
+Tests for the meeting_stats triggers.
+
+The triggers are PL/pgSQL, so these tests need a PostgreSQL database and
+are skipped unless TEST_POSTGRES_URL (an asyncpg URL) is set. create_all
+installs them there, as it does for init_db.
+"""
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from dapmeet.db.db import Base
+from dapmeet.models.chat_message import ChatMessage
+from dapmeet.models.meeting import Meeting
+from dapmeet.models.meeting_stats import MeetingStats
+from dapmeet.models.segment import TranscriptSegment
+from tests.factories import ChatMessageFactory, MeetingFactory, TranscriptSegmentFactory, UserFactory
+
+TEST_POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(not TEST_POSTGRES_URL, reason="TEST_POSTGRES_URL is not set"),
+]
+
+T0 = datetime(2025, 11, 25, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def pg_session():
+    """Session on a PostgreSQL schema with the meeting_stats triggers installed."""
+    engine = create_async_engine(TEST_POSTGRES_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def meetings(pg_session: AsyncSession):
+    """Two meetings of one user."""
+    user = UserFactory.create()
+    first = MeetingFactory.create(unique_session_id="session-a", user_id=user.id)
+    second = MeetingFactory.create(unique_session_id="session-b", user_id=user.id)
+    pg_session.add(user)
+    await pg_session.flush()
+    pg_session.add_all([first, second])
+    await pg_session.commit()
+    return first, second
+
+
+async def _stats(db: AsyncSession, session_id: str):
+    return await db.get(MeetingStats, session_id, populate_existing=True)
+
+
+async def _add_segments(db: AsyncSession, session_id: str, minutes):
+    segments = [
+        TranscriptSegmentFactory.create(session_id=session_id, timestamp=T0 + timedelta(minutes=m))
+        for m in minutes
+    ]
+    db.add_all(segments)
+    await db.commit()
+    return segments
+
+
+class TestSegmentTrigger:
+    """Test segment_count / first_ts / last_ts maintenance."""
+
+    @pytest.mark.asyncio
+    async def test_insert(self, pg_session: AsyncSession, meetings):
+        """Test inserts create and extend the stats row."""
+        await _add_segments(pg_session, "session-a", [5, 0, 10])
+
+        stats = await _stats(pg_session, "session-a")
+        assert stats.segment_count == 3
+        assert stats.first_ts == T0
+        assert stats.last_ts == T0 + timedelta(minutes=10)
+
+    @pytest.mark.asyncio
+    async def test_delete(self, pg_session: AsyncSession, meetings):
+        """Test deleting the last segment shrinks the range."""
+        segments = await _add_segments(pg_session, "session-a", [0, 5, 10])
+
+        await pg_session.execute(delete(TranscriptSegment).where(TranscriptSegment.id == segments[2].id))
+        await pg_session.commit()
+
+        stats = await _stats(pg_session, "session-a")
+        assert stats.segment_count == 2
+        assert stats.last_ts == T0 + timedelta(minutes=5)
+
+    @pytest.mark.asyncio
+    async def test_update_timestamp(self, pg_session: AsyncSession, meetings):
+        """Test moving a segment's timestamp recomputes the range."""
+        segments = await _add_segments(pg_session, "session-a", [0, 5])
+
+        await pg_session.execute(
+            update(TranscriptSegment)
+            .where(TranscriptSegment.id == segments[0].id)
+            .values(timestamp=T0 + timedelta(minutes=20))
+        )
+        await pg_session.commit()
+
+        stats = await _stats(pg_session, "session-a")
+        assert stats.segment_count == 2
+        assert stats.first_ts == T0 + timedelta(minutes=5)
+        assert stats.last_ts == T0 + timedelta(minutes=20)
+
+    @pytest.mark.asyncio
+    async def test_update_session_id(self, pg_session: AsyncSession, meetings):
+        """Test moving a segment to another meeting updates both meetings."""
+        segments = await _add_segments(pg_session, "session-a", [0, 5])
+        await _add_segments(pg_session, "session-b", [30])
+
+        await pg_session.execute(
+            update(TranscriptSegment)
+            .where(TranscriptSegment.id == segments[1].id)
+            .values(session_id="session-b")
+        )
+        await pg_session.commit()
+
+        old = await _stats(pg_session, "session-a")
+        assert old.segment_count == 1
+        assert old.last_ts == T0
+        new = await _stats(pg_session, "session-b")
+        assert new.segment_count == 2
+        assert new.first_ts == T0 + timedelta(minutes=5)
+
+    @pytest.mark.asyncio
+    async def test_meeting_cascade_delete(self, pg_session: AsyncSession, meetings):
+        """Test deleting a meeting removes its stats row with its segments."""
+        await _add_segments(pg_session, "session-a", [0, 5])
+
+        await pg_session.execute(delete(Meeting).where(Meeting.unique_session_id == "session-a"))
+        await pg_session.commit()
+
+        assert await _stats(pg_session, "session-a") is None
+
+
+class TestMessageTrigger:
+    """Test message_count / last_message_ts maintenance."""
+
+    @pytest.mark.asyncio
+    async def test_insert_and_delete(self, pg_session: AsyncSession, meetings):
+        """Test message inserts count up and deletes count down."""
+        messages = [
+            ChatMessageFactory.create(session_id="session-a", created_at=T0 + timedelta(minutes=m))
+            for m in (0, 5)
+        ]
+        pg_session.add_all(messages)
+        await pg_session.commit()
+
+        stats = await _stats(pg_session, "session-a")
+        assert stats.message_count == 2
+        assert stats.last_message_ts == T0 + timedelta(minutes=5)
+
+        await pg_session.execute(delete(ChatMessage).where(ChatMessage.id == messages[1].id))
+        await pg_session.commit()
+
+        stats = await _stats(pg_session, "session-a")
+        assert stats.message_count == 1
+        assert stats.last_message_ts == T0